@@ -101,47 +101,47 @@ def save_reports(ticker: str, trade_date: str, reports: dict) -> dict | None:
         print("  Warning: No storage configured")
         return None
 
-    storage = StorageService(storage_config)
     job_id = uuid.uuid4().hex[:8]
     prefix = f"{ticker}_{trade_date}_{job_id}"
     report_results = {}
 
-    for name, content in reports.items():
-        if not content:
-            continue
+    with StorageService(storage_config) as storage:
+        for name, content in reports.items():
+            if not content:
+                continue
 
-        md_key = f"{prefix}/{name}.md"
-        paths = storage.upload_report_auto(
-            content, md_key, content_type="text/markdown"
-        )
+            md_key = f"{prefix}/{name}.md"
+            paths = storage.upload_report_auto(
+                content, md_key, content_type="text/markdown"
+            )
 
-        report_results[name] = {
-            "paths": paths,
-            "url": storage.get_report_url(md_key),
-        }
+            report_results[name] = {
+                "paths": paths,
+                "url": storage.get_report_url(md_key),
+            }
+
+        # Convert to PDF if available and local storage exists
+        if PDF_AVAILABLE:
+            local_dir = storage.get_local_path(prefix)
+            if local_dir:
+                local_path = Path(local_dir).parent / prefix
+                if local_path.exists():
+                    pdf_paths = convert_reports_to_pdf(local_path)
+                    for pdf_path in pdf_paths:
+                        pdf_key = f"{prefix}/{pdf_path.name}"
+                        pdf_result = storage.upload_file(pdf_path, pdf_key)
+                        report_name = pdf_path.stem
+                        if report_name in report_results:
+                            report_results[report_name]["pdf_paths"] = pdf_result
+                            report_results[report_name]["pdf_url"] = storage.get_report_url(pdf_key)
 
-    # Convert to PDF if available and local storage exists
-    if PDF_AVAILABLE:
-        local_dir = storage.get_local_path(prefix)
-        if local_dir:
-            local_path = Path(local_dir).parent / prefix
-            if local_path.exists():
-                pdf_paths = convert_reports_to_pdf(local_path)
-                for pdf_path in pdf_paths:
-                    pdf_key = f"{prefix}/{pdf_path.name}"
-                    pdf_result = storage.upload_file(pdf_path, pdf_key)
-                    report_name = pdf_path.stem
-                    if report_name in report_results:
-                        report_results[report_name]["pdf_paths"] = pdf_result
-                        report_results[report_name]["pdf_url"] = storage.get_report_url(pdf_key)
-
-    return {
-        "prefix": prefix,
-        "reports": report_results,
-        "backends": storage.backends,
-        "primary_backend": storage.primary_backend,
-        "is_r2_enabled": storage.is_r2_enabled,
-    }
+        return {
+            "prefix": prefix,
+            "reports": report_results,
+            "backends": storage.backends,
+            "primary_backend": storage.primary_backend,
+            "is_r2_enabled": storage.is_r2_enabled,
+        }
 
 
 def send_discord_notification(
@@ -0,0 +1,498 @@
+"""Tests for the Google Sheets portfolio service."""
+
+import re
+
+import pytest
+
+from tradingagents.portfolio.google_sheets import GoogleSheetsPortfolio
+from tradingagents.portfolio.models import PortfolioSummary, Position, Transaction
+
+POSITION_HEADERS = [
+    "Ticker", "Shares", "Avg Cost", "Current Price", "Market Value", "Unrealized P&L", "% of Portfolio"
+]
+TRANSACTION_HEADERS = ["Date", "Ticker", "Type", "Shares", "Price", "Fees", "Total", "Notes"]
+
+LEGACY_POSITIONS = [
+    ["MSFT", "5", "200", "180", "900", "-100", "30"],
+    ["AAPL", "10", "100", "110", "1100", "100", "36.7"],
+]
+LEGACY_TRANSACTIONS = [
+    ["2024-01-02", "MSFT", "buy", "5", "200", "0", "-1000"],
+    ["2024-01-01", "AAPL", "buy", "10", "100", "1", "-1001"],
+]
+
+
+def _column_index(letters):
+    """Convert column letters ("A", "H") to a zero-based index."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _parse_range(range_name):
+    """Split an A1 range into (sheet, first_row, last_row, first_col, last_col)."""
+    sheet, _, cells = range_name.partition("!")
+    match = re.fullmatch(r"([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?", cells)
+    col1, row1, col2, row2 = match.groups()
+    first_row = int(row1) - 1 if row1 else 0
+    if match.group(3) is None:
+        last_row = first_row if row1 else 10**6
+    else:
+        last_row = int(row2) - 1 if row2 else 10**6
+    return sheet, first_row, last_row, _column_index(col1), _column_index(col2 or col1)
+
+
+class _Request:
+    """Stand-in for a googleapiclient HttpRequest."""
+
+    def __init__(self, service, method, action):
+        self._service = service
+        self._method = method
+        self._action = action
+
+    def execute(self):
+        self._service.calls.append(self._method)
+        count = self._service.calls.count(self._method) - 1
+        if (self._method, count) in self._service.failures:
+            raise RuntimeError(f"{self._method} call {count} failed")
+        return self._action()
+
+
+class FakeSheetsService:
+    """In-memory stand-in for the parts of the Sheets v4 API the service uses.
+
+    Cells are stored as the strings written. Reads evaluate the QUERY
+    formulas written by GoogleSheetsPortfolio unless FORMULA rendering is
+    requested. ``failures`` holds (method, n) pairs making the n-th call
+    (zero-based) of that method raise.
+    """
+
+    _QUERY_RE = re.compile(
+        r'=QUERY\((\w+)!A2:[A-Z], "select \* where A is not null order by ([A-Z]) desc", 0\)'
+    )
+
+    def __init__(self, sheets=None):
+        self.sheets = {title: [list(row) for row in rows] for title, rows in (sheets or {}).items()}
+        self.hidden = set()
+        self.calls = []
+        self.failures = set()
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    # Cell storage
+
+    def _evaluate(self, title):
+        rows = []
+        for row in self.sheets.get(title, []):
+            match = self._QUERY_RE.match(row[0]) if row else None
+            if match is None:
+                rows.append(row)
+                continue
+            source = [r for r in self.sheets.get(match.group(1), [])[1:] if r and r[0]]
+            key = _column_index(match.group(2))
+
+            def sort_key(r):
+                try:
+                    return (0, float(r[key]), "")
+                except ValueError:
+                    return (1, 0.0, r[key])
+
+            rows.extend(sorted(source, key=sort_key, reverse=True))
+        return rows
+
+    def read(self, range_name, formulas=False):
+        sheet, first_row, last_row, first_col, last_col = _parse_range(range_name)
+        if sheet not in self.sheets:
+            raise RuntimeError(f"Unable to parse range: {range_name}")
+        rows = self.sheets[sheet] if formulas else self._evaluate(sheet)
+        result = [row[first_col:last_col + 1] for row in rows[first_row:last_row + 1]]
+        # The API trims trailing empty cells and rows
+        result = [row[: max([i + 1 for i, v in enumerate(row) if v != ""] or [0])] for row in result]
+        while result and not result[-1]:
+            result.pop()
+        return result
+
+    def write(self, range_name, values):
+        sheet, first_row, _, first_col, _ = _parse_range(range_name)
+        if sheet not in self.sheets:
+            raise RuntimeError(f"Unable to parse range: {range_name}")
+        data = self.sheets[sheet]
+        for offset, row in enumerate(values):
+            while len(data) <= first_row + offset:
+                data.append([])
+            target = data[first_row + offset]
+            while len(target) < first_col + len(row):
+                target.append("")
+            for col, value in enumerate(row):
+                target[first_col + col] = str(value)
+
+    # spreadsheets
+
+    def get(self, spreadsheetId, ranges=None, includeGridData=False, fields=None):
+        def action():
+            sheets = []
+            grids = {}
+            for range_name in ranges or []:
+                grids.setdefault(range_name.partition("!")[0], []).append(self.read(range_name))
+            # With ranges, the API only returns the sheets they touch
+            titles = list(grids) if ranges else list(self.sheets)
+            for title in titles:
+                entry = {"properties": {"title": title}}
+                if includeGridData:
+                    entry["data"] = [
+                        {"rowData": [{"values": [{"formattedValue": v} for v in row]} for row in grid]}
+                        for grid in grids.get(title, [])
+                    ]
+                sheets.append(entry)
+            return {"sheets": sheets}
+
+        return _Request(self, "get", action)
+
+    def batchUpdate(self, spreadsheetId, body):
+        if "data" in body:
+            def action():
+                for update in body["data"]:
+                    self.write(update["range"], update["values"])
+                return {}
+
+            return _Request(self, "values.batchUpdate", action)
+
+        def action():
+            for request in body["requests"]:
+                title = request["addSheet"]["properties"]["title"]
+                if title in self.sheets:
+                    raise RuntimeError(f'A sheet with the name "{title}" already exists')
+            for request in body["requests"]:
+                properties = request["addSheet"]["properties"]
+                self.sheets.setdefault(properties["title"], [])
+                if properties.get("hidden"):
+                    self.hidden.add(properties["title"])
+            return {}
+
+        return _Request(self, "batchUpdate", action)
+
+    # spreadsheets.values
+
+    def batchGet(self, spreadsheetId, ranges, valueRenderOption=None):
+        def action():
+            formulas = valueRenderOption == "FORMULA"
+            return {
+                "valueRanges": [
+                    {"range": r, "values": self.read(r, formulas)} for r in ranges
+                ]
+            }
+
+        return _Request(self, "values.batchGet", action)
+
+    def append(self, spreadsheetId, range, valueInputOption, insertDataOption, body):
+        def action():
+            data = self.sheets[range.partition("!")[0]]
+            while data and not any(data[-1]):
+                data.pop()
+            data.extend([str(v) for v in row] for row in body["values"])
+            return {}
+
+        return _Request(self, "values.append", action)
+
+
+def make_portfolio_service(fake):
+    """Create a GoogleSheetsPortfolio wired to a fake API service."""
+    portfolio = GoogleSheetsPortfolio("sheet-id", "/nonexistent/credentials.json")
+    portfolio._service = fake
+    return portfolio
+
+
+def legacy_sheets():
+    """Sheets of a spreadsheet from before the raw sheets existed."""
+    return {
+        "Positions": [POSITION_HEADERS] + LEGACY_POSITIONS,
+        "Transactions": [TRANSACTION_HEADERS] + LEGACY_TRANSACTIONS,
+        "Summary": [["Total Value", "3000"], ["Cash Balance", "1000"]],
+    }
+
+
+class TestMigration:
+    """Tests for moving legacy sheets behind QUERY views."""
+
+    # Calls made by initialize_sheets on a legacy spreadsheet, in order:
+    # addSheet, read formulas, read rows, copy rows, read copy, write views
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            ("batchUpdate", 0),
+            ("values.batchGet", 0),
+            ("values.batchGet", 1),
+            ("values.batchUpdate", 0),
+            ("values.batchGet", 2),
+            ("values.batchUpdate", 1),
+        ],
+    )
+    def test_failed_step_keeps_rows(self, failure):
+        """A failure at any migration step should not lose rows, and a retry completes it."""
+        fake = FakeSheetsService(legacy_sheets())
+        fake.failures.add(failure)
+        service = make_portfolio_service(fake)
+
+        try:
+            service.initialize_sheets()
+        except RuntimeError:
+            pass
+
+        assert fake.read("Positions!A2:G") == LEGACY_POSITIONS
+        assert fake.read("Transactions!A2:H") == LEGACY_TRANSACTIONS
+
+        fake.failures.clear()
+        service.initialize_sheets()
+
+        portfolio = service.get_portfolio()
+        assert [p.ticker for p in portfolio.positions] == ["AAPL", "MSFT"]
+        assert list(portfolio.transactions.date) == ["2024-01-02", "2024-01-01"]
+        assert fake.sheets["Positions_raw"][1:] == LEGACY_POSITIONS
+
+    def test_incomplete_copy_keeps_rows(self, monkeypatch):
+        """If the raw sheet does not read back every row, the visible rows stay."""
+        fake = FakeSheetsService(legacy_sheets())
+        service = make_portfolio_service(fake)
+        write = fake.write
+
+        def lossy_write(range_name, values):
+            if range_name.startswith("Positions_raw"):
+                values = values[:-1]
+            write(range_name, values)
+
+        monkeypatch.setattr(fake, "write", lossy_write)
+
+        with pytest.raises(RuntimeError):
+            service.initialize_sheets()
+
+        assert fake.read("Positions!A2:G") == LEGACY_POSITIONS
+        assert fake.read("Transactions!A2:H") == LEGACY_TRANSACTIONS
+
+    def test_legacy_spreadsheet_migrated(self):
+        """initialize_sheets should move legacy rows into hidden raw sheets behind views."""
+        fake = FakeSheetsService(legacy_sheets())
+        service = make_portfolio_service(fake)
+
+        service.initialize_sheets()
+
+        assert fake.hidden == {"Positions_raw", "Transactions_raw"}
+        assert fake.sheets["Positions_raw"] == [POSITION_HEADERS] + LEGACY_POSITIONS
+        assert fake.sheets["Transactions_raw"] == [TRANSACTION_HEADERS] + LEGACY_TRANSACTIONS
+        assert fake.sheets["Positions"][1][0] == service.POSITIONS_QUERY
+        # The views show the rows sorted by market value and date
+        assert fake.read("Positions!A2:A") == [["AAPL"], ["MSFT"]]
+        assert fake.read("Transactions!A2:A") == [["2024-01-02"], ["2024-01-01"]]
+
+    def test_migrated_spreadsheet_left_alone(self):
+        """A second initialize_sheets should only read."""
+        fake = FakeSheetsService(legacy_sheets())
+        service = make_portfolio_service(fake)
+        service.initialize_sheets()
+        fake.calls.clear()
+
+        service.initialize_sheets()
+
+        assert fake.calls == ["get", "values.batchGet"]
+
+    def test_missing_visible_sheet_recreated(self):
+        """A visible sheet deleted after migration should be recreated on its own."""
+        fake = FakeSheetsService(legacy_sheets())
+        service = make_portfolio_service(fake)
+        service.initialize_sheets()
+        del fake.sheets["Summary"]
+        fake.calls.clear()
+
+        service.initialize_sheets()
+
+        assert "Summary" in fake.sheets
+        assert fake.calls.count("batchUpdate") == 1
+        assert fake.sheets["Positions_raw"] == [POSITION_HEADERS] + LEGACY_POSITIONS
+
+    def test_new_spreadsheet(self):
+        """initialize_sheets should create every sheet with headers on an empty spreadsheet."""
+        fake = FakeSheetsService()
+        service = make_portfolio_service(fake)
+
+        service.initialize_sheets()
+
+        assert set(fake.sheets) == {
+            "Positions", "Transactions", "Summary", "Positions_raw", "Transactions_raw"
+        }
+        assert fake.sheets["Positions"][0] == POSITION_HEADERS
+        assert fake.sheets["Transactions_raw"][0] == TRANSACTION_HEADERS
+        assert service.get_portfolio().position_count == 0
+
+
+class TestGoogleSheetsPortfolio:
+    """Tests for loading and saving a portfolio through the Sheets API."""
+
+    @pytest.fixture
+    def fake(self):
+        """Create an initialized, empty spreadsheet."""
+        fake = FakeSheetsService()
+        make_portfolio_service(fake).initialize_sheets()
+        return fake
+
+    @pytest.fixture
+    def service(self, fake):
+        """Create the portfolio service over the fake spreadsheet."""
+        return make_portfolio_service(fake)
+
+    @pytest.fixture
+    def portfolio(self):
+        """Create a portfolio with two positions and two transactions."""
+        return PortfolioSummary(
+            total_value=3000.0,
+            cash_balance=1000.0,
+            positions=[
+                Position("MSFT", 5.0, 200.0, 180.0, 900.0, -100.0, 30.0),
+                Position("AAPL", 1 / 3, 100.0, 110.0, 110 / 3, 10 / 3, 1.25),
+            ],
+            transactions=[
+                Transaction("2024-01-01", "AAPL", "buy", 1 / 3, 100.0, fees=1.0),
+                Transaction("2024-01-02", "MSFT", "buy", 5.0, 200.0),
+            ],
+            overall_pnl=-96.67,
+            last_updated="2024-01-03T00:00:00",
+        )
+
+    def test_save_load_round_trip(self, service, portfolio):
+        """get_portfolio should return what save_portfolio wrote."""
+        service.save_portfolio(portfolio)
+        loaded = service.get_portfolio()
+
+        assert loaded.total_value == 3000.0
+        assert loaded.cash_balance == 1000.0
+        # Positions come back largest first, transactions newest first
+        assert [p.ticker for p in loaded.positions] == ["MSFT", "AAPL"]
+        aapl = loaded.get_position("AAPL")
+        assert aapl.shares == pytest.approx(1 / 3, abs=1e-6)
+        assert aapl.portfolio_percentage == 1.25
+        assert [t.ticker for t in loaded.transactions] == ["MSFT", "AAPL"]
+        assert loaded.transactions[1].total == pytest.approx(-(100 / 3 + 1.0), abs=1e-4)
+
+    def test_save_formats_numbers(self, service, fake, portfolio):
+        """Numbers should be written as the shortest exact float repr."""
+        service.save_portfolio(portfolio)
+
+        aapl = fake.sheets["Positions_raw"][2]
+        assert aapl[:3] == ["AAPL", "0.3333333333333333", "100.0"]
+        transaction = fake.sheets["Transactions_raw"][1]
+        assert transaction[3:7] == ["0.3333333333333333", "100.0", "1.0", "-34.33333333333333"]
+
+    def test_sub_cent_prices_round_trip(self, service):
+        """Sub-cent prices should load back exactly instead of rounding to zero."""
+        service.save_portfolio(
+            PortfolioSummary(
+                total_value=30.0,
+                cash_balance=0.0,
+                positions=[Position("PENNY", 1e6, 0.00004, 0.00003, 30.0, -10.0, 100.0)],
+                transactions=[Transaction("2024-01-01", "PENNY", "buy", 1e6, 0.00004)],
+            )
+        )
+        service.add_transaction(Transaction("2024-01-02", "PENNY", "sell", 0.1, 0.00003))
+
+        loaded = service.get_portfolio()
+
+        position = loaded.get_position("PENNY")
+        assert (position.avg_cost, position.current_price) == (0.00004, 0.00003)
+        assert [t.price for t in loaded.transactions] == [0.00003, 0.00004]
+        assert loaded.transactions[0].total == 0.1 * 0.00003
+
+    def test_malformed_cells_fall_back_to_row_parsing(self, service, fake):
+        """A malformed cell should skip only its row."""
+        fake.sheets["Positions_raw"] += [
+            ["AAPL", "10", "100", "110", "1100", "100", "50"],
+            ["MSFT", "n/a", "200", "180", "900", "-100", "30"],
+        ]
+        fake.sheets["Transactions_raw"] += [
+            ["2024-01-02", "aapl", "BUY", "10", "100", "", "-1000"],
+            ["2024-01-01", "MSFT", "buy", "five", "200", "0", "-1000"],
+        ]
+
+        loaded = service.get_portfolio()
+
+        assert [p.ticker for p in loaded.positions] == ["AAPL"]
+        assert len(loaded.transactions) == 1
+        transaction = loaded.transactions[0]
+        assert (transaction.ticker, transaction.type) == ("AAPL", "buy")
+        assert transaction.total == -1000.0
+
+    def test_closed_positions_skipped(self, service, fake):
+        """Rows with zero shares should not be loaded."""
+        fake.sheets["Positions_raw"] += [
+            ["AAPL", "10", "100", "110", "1100", "100", "50"],
+            ["MSFT", "0", "200", "180", "0", "0", "0"],
+        ]
+
+        assert [p.ticker for p in service.get_portfolio().positions] == ["AAPL"]
+
+    def test_invalid_transactions_skipped(self, service, fake):
+        """Rows with a bad type, shares, price or fees should not be loaded."""
+        fake.sheets["Transactions_raw"] += [
+            ["2024-01-06", "AAPL", "sell", "5", "120", "1", "599"],
+            ["2024-01-05", "AAPL", "dividend", "1", "2", "0", "2"],
+            ["2024-01-04", "AAPL", " ", "1", "2", "0", "2"],
+            ["2024-01-03", "AAPL", "buy", "0", "100", "0", "0"],
+            ["2024-01-02", "AAPL", "buy", "10", "-100", "0", "1000"],
+            ["2024-01-01", "AAPL", "buy", "10", "100", "-1", "-999"],
+        ]
+
+        transactions = service.get_portfolio().transactions
+
+        assert len(transactions) == 1
+        transaction = transactions[0]
+        assert (transaction.date, transaction.type) == ("2024-01-06", "sell")
+        assert transaction.total == 599.0
+
+    def test_load_summary(self, service):
+        """_load_summary should parse numbers and keep other values as text."""
+        summary = service._load_summary(
+            [
+                ["Total Value", "3000"],
+                ["Cash Balance", "oops"],
+                ["Last Updated", "2024-01-03"],
+                ["Incomplete"],
+            ]
+        )
+
+        assert summary == {"total_value": 3000.0, "last_updated": "2024-01-03"}
+
+    def test_add_transaction_appends_raw_row(self, service, fake, portfolio):
+        """add_transaction should append one row that shows up sorted in the view."""
+        service.save_portfolio(portfolio)
+        fake.calls.clear()
+
+        service.add_transaction(Transaction("2024-01-05", "GOOG", "buy", 1, 150.0))
+
+        assert fake.calls == ["values.append"]
+        dates = [t.date for t in service.get_portfolio().transactions]
+        assert dates == ["2024-01-05", "2024-01-02", "2024-01-01"]
+
+    def test_update_position(self, service, portfolio):
+        """update_position should reprice an existing position in one read and write."""
+        service.save_portfolio(portfolio)
+
+        service.update_position("MSFT", current_price=220.0)
+
+        msft = service.get_portfolio().get_position("MSFT")
+        assert msft.current_price == 220.0
+        assert msft.market_value == 1100.0
+        assert msft.unrealized_pnl == 100.0
+
+    def test_reprice_positions(self, service, fake, portfolio):
+        """reprice_positions should update many positions in one read and one write."""
+        service.save_portfolio(portfolio)
+        fake.calls.clear()
+
+        service.reprice_positions({"AAPL": 120.0, "MSFT": 190.0})
+
+        assert fake.calls == ["values.batchGet", "values.batchUpdate"]
+        loaded = service.get_portfolio()
+        assert loaded.get_position("AAPL").current_price == 120.0
+        assert loaded.get_position("MSFT").market_value == 950.0
@@ -0,0 +1,214 @@
+"""Tests for portfolio data models."""
+
+import pytest
+
+from tradingagents.portfolio.models import (
+    PortfolioSummary,
+    Position,
+    PositionArray,
+    Transaction,
+    TransactionLog,
+)
+
+
+def make_position(ticker="AAPL", shares=10.0, avg_cost=100.0, current_price=110.0):
+    """Create a Position with consistent derived values."""
+    return Position(
+        ticker=ticker,
+        shares=shares,
+        avg_cost=avg_cost,
+        current_price=current_price,
+        market_value=shares * current_price,
+        unrealized_pnl=(current_price - avg_cost) * shares,
+        portfolio_percentage=0.0,
+    )
+
+
+class TestPosition:
+    """Tests for Position."""
+
+    def test_ticker_normalized(self):
+        """Ticker should be upper-cased and stripped."""
+        assert make_position(ticker=" aapl ").ticker == "AAPL"
+
+    def test_invalid_shares_rejected(self):
+        """Non-positive shares should raise ValueError."""
+        with pytest.raises(ValueError):
+            make_position(shares=0)
+
+    def test_unrealized_pnl_percentage(self):
+        """P&L percentage should be computed from price and cost."""
+        assert make_position().unrealized_pnl_percentage == pytest.approx(10.0)
+
+    def test_unrealized_pnl_percentage_follows_price(self):
+        """P&L percentage should reflect a price changed after construction."""
+        position = make_position()
+        position.current_price = 120.0
+        assert position.unrealized_pnl_percentage == pytest.approx(20.0)
+
+    def test_is_profitable(self):
+        """is_profitable should follow the sign of unrealized P&L."""
+        assert make_position(current_price=110.0).is_profitable
+        assert not make_position(current_price=90.0).is_profitable
+
+    def test_round_trip(self):
+        """from_dict(to_dict()) should reproduce the position."""
+        position = make_position()
+        assert Position.from_dict(position.to_dict()) == position
+
+    def test_from_row(self):
+        """_from_row should parse a sheet row and normalize the ticker."""
+        row = [" aapl", "10", "100", "110", "1100", "100", "50"]
+        position = Position._from_row(row)
+        assert position.ticker == "AAPL"
+        assert position.shares == 10.0
+        assert position.portfolio_percentage == 50.0
+
+    def test_from_row_rejects_closed_position(self):
+        """_from_row should reject rows with zero shares, like the constructor."""
+        with pytest.raises(ValueError):
+            Position._from_row(["AAPL", "0", "100", "110", "0", "0", "0"])
+
+
+class TestTransaction:
+    """Tests for Transaction."""
+
+    def test_total_derived_for_buy(self):
+        """Buy total should be negative cost including fees."""
+        transaction = Transaction("2024-01-01", "aapl", "BUY", 10, 100.0, fees=1.0)
+        assert transaction.total == -1001.0
+
+    def test_invalid_type_rejected(self):
+        """Unknown transaction types should raise ValueError."""
+        with pytest.raises(ValueError):
+            Transaction("2024-01-01", "AAPL", "hold", 10, 100.0)
+
+    def test_from_row_derives_total(self):
+        """_from_row should normalize fields and derive a missing total."""
+        row = ["2024-01-01", " aapl ", " Sell ", "10", "100", "1", ""]
+        transaction = Transaction._from_row(row)
+        assert transaction.ticker == "AAPL"
+        assert transaction.type == "sell"
+        assert transaction.total == 999.0
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            ["2024-01-01", "AAPL", "dividend", "10", "100", "0", ""],
+            ["2024-01-01", "AAPL", "buy", "0", "100", "0", ""],
+            ["2024-01-01", "AAPL", "buy", "10", "-1", "0", ""],
+            ["2024-01-01", "AAPL", "buy", "10", "100", "-1", ""],
+        ],
+    )
+    def test_from_row_rejects_invalid_rows(self, row):
+        """_from_row should apply the same checks as the constructor."""
+        with pytest.raises(ValueError):
+            Transaction._from_row(row)
+
+
+class TestTransactionLog:
+    """Tests for TransactionLog."""
+
+    @pytest.fixture
+    def log(self):
+        """Create a log with one buy and one sell."""
+        return TransactionLog.from_transactions(
+            [
+                Transaction("2024-01-02", "AAPL", "buy", 10, 100.0, fees=1.0),
+                Transaction("2024-01-05", "AAPL", "sell", 5, 120.0),
+            ]
+        )
+
+    def test_iterates_transactions(self, log):
+        """Iteration should yield equivalent Transaction objects."""
+        assert [t.type for t in log] == ["buy", "sell"]
+        assert log[1] == Transaction("2024-01-05", "AAPL", "sell", 5, 120.0)
+
+    def test_aggregates(self, log):
+        """Column aggregates should be vectorized sums."""
+        assert log.net_cash_flow == pytest.approx(-1001.0 + 600.0)
+        assert log.total_fees == pytest.approx(1.0)
+
+    def test_append(self, log):
+        """append should add a row at the end."""
+        log.append(Transaction("2024-01-06", "msft", "buy", 1, 10.0))
+        assert len(log) == 3
+        assert log[2].ticker == "MSFT"
+
+
+class TestPortfolioSummary:
+    """Tests for PortfolioSummary."""
+
+    @pytest.fixture
+    def portfolio(self):
+        """Create a portfolio with two positions."""
+        return PortfolioSummary(
+            total_value=3000.0,
+            cash_balance=1000.0,
+            positions=[
+                make_position("AAPL", 10.0, 100.0, 110.0),
+                make_position("MSFT", 5.0, 200.0, 180.0),
+            ],
+        )
+
+    def test_positions_stored_columnar(self, portfolio):
+        """Positions passed as a list should be converted to PositionArray."""
+        assert isinstance(portfolio.positions, PositionArray)
+        assert portfolio.invested_value == pytest.approx(2000.0)
+
+    def test_assigned_lists_stored_columnar(self, portfolio):
+        """Lists assigned after construction should be converted too."""
+        portfolio.positions = [make_position("GOOG", 2.0, 100.0, 150.0)]
+        portfolio.transactions = [Transaction("2024-01-01", "GOOG", "buy", 2, 100.0)]
+
+        assert isinstance(portfolio.positions, PositionArray)
+        assert isinstance(portfolio.transactions, TransactionLog)
+        assert portfolio.invested_value == pytest.approx(300.0)
+        assert portfolio.get_position("goog").shares == 2.0
+
+    def test_get_position(self, portfolio):
+        """get_position should look up by normalized ticker."""
+        assert portfolio.get_position(" msft ").shares == 5.0
+        assert portfolio.get_position("GOOG") is None
+
+    def test_set_position_adds_and_replaces(self, portfolio):
+        """set_position should replace an existing ticker or append a new one."""
+        portfolio.set_position(make_position("AAPL", 20.0))
+        portfolio.set_position(make_position("GOOG", 1.0))
+        assert portfolio.get_position("AAPL").shares == 20.0
+        assert portfolio.position_count == 3
+
+    def test_reprice(self, portfolio):
+        """reprice should update values and P&L percentages."""
+        portfolio.reprice({"aapl": 120.0, "TSLA": 1.0})
+        position = portfolio.get_position("AAPL")
+        assert position.market_value == pytest.approx(1200.0)
+        assert position.unrealized_pnl == pytest.approx(200.0)
+        assert position.unrealized_pnl_percentage == pytest.approx(20.0)
+        assert portfolio.positions.unrealized_pnl_percentage[0] == pytest.approx(20.0)
+
+    def test_round_trip(self, portfolio):
+        """from_dict(to_dict()) should reproduce the portfolio."""
+        assert PortfolioSummary.from_dict(portfolio.to_dict()) == portfolio
+
+    def test_format_summary_orders_by_value(self, portfolio):
+        """Positions should be listed largest market value first."""
+        summary = portfolio.format_summary()
+        assert summary.index("AAPL") < summary.index("MSFT")
+        assert "(+10.0%)" in summary
+
+    def test_format_summary_reflects_changes(self, portfolio):
+        """Summary text should follow every change to the portfolio."""
+        portfolio.format_summary()
+        portfolio.positions[0] = make_position(ticker="GOOG")
+        assert "GOOG" in portfolio.format_summary()
+        portfolio.reprice({"GOOG": 150.0})
+        assert "$150.00" in portfolio.format_summary()
+        portfolio.cash_balance = 500.0
+        assert "$500.00" in portfolio.format_summary()
+
+    def test_json_round_trip(self, portfolio):
+        """from_json(to_json()) should reproduce the portfolio."""
+        data = portfolio.to_json()
+        assert isinstance(data, bytes)
+        assert PortfolioSummary.from_json(data) == portfolio
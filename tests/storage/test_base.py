@@ -0,0 +1,73 @@
+"""Tests for the storage backend base class."""
+
+from tradingagents.config import R2StorageConfig
+from tradingagents.storage.backends.local import LocalStorageBackend
+from tradingagents.storage.backends.r2 import R2StorageBackend
+from tradingagents.storage.base import BaseStorageBackend
+
+
+class TestBaseStorageBackend:
+    """Tests for BaseStorageBackend."""
+
+    def test_base_supports_nothing(self):
+        """The base class should report no supported methods."""
+        assert not BaseStorageBackend().supports("upload_file")
+
+    def test_supports_overridden_methods(self, tmp_path):
+        """supports should be True only for methods the subclass overrides."""
+
+        class UploadOnlyBackend(BaseStorageBackend):
+            backend_name = "upload-only"
+
+            def upload_bytes(self, data, remote_key, content_type=None):
+                return remote_key
+
+        backend = UploadOnlyBackend()
+
+        assert backend.supports("upload_bytes")
+        assert not backend.supports("upload_file")
+        assert not backend.supports("backend_name")
+        assert LocalStorageBackend(str(tmp_path)).supports("list_files")
+
+    def test_supports_inherited_overrides(self):
+        """A subclass of a backend should inherit its capabilities."""
+
+        class Parent(BaseStorageBackend):
+            def exists(self, remote_key):
+                return False
+
+        class Child(Parent):
+            pass
+
+        assert Child().supports("exists")
+        assert not Child().supports("delete")
+
+    def test_supports_every_public_method(self):
+        """supports should cover every public method, including later additions."""
+        public_methods = {
+            name
+            for name, value in vars(BaseStorageBackend).items()
+            if not name.startswith("_") and callable(value) and name != "supports"
+        }
+        full_backend = type(
+            "FullBackend",
+            (BaseStorageBackend,),
+            {name: lambda self, *args: None for name in public_methods},
+        )
+
+        assert {"delete_many", "invalidate"} <= public_methods
+        assert all(full_backend().supports(name) for name in public_methods)
+
+    def test_r2_supports_bulk_delete(self):
+        """R2 overrides delete_many and invalidate, so supports should say so."""
+        backend = R2StorageBackend(
+            R2StorageConfig(
+                account_id="test_account",
+                access_key_id="test_key",
+                secret_access_key="test_secret",
+                bucket_name="test-bucket",
+            )
+        )
+
+        assert backend.supports("delete_many")
+        assert backend.supports("invalidate")
@@ -1,7 +1,9 @@
 """Tests for local storage backend."""
 
+import shutil
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -48,6 +50,24 @@ class TestLocalStorageBackend:
 
         assert (temp_dir / "deep/nested/path/file.txt").exists()
 
+    def test_upload_bytes_reuses_known_directory(self, storage):
+        """upload_bytes should create a parent directory only once."""
+        storage.upload_bytes(b"a", "reports/a.md")
+
+        with mock.patch.object(Path, "mkdir") as mkdir:
+            storage.upload_bytes(b"b", "reports/b.md")
+
+        mkdir.assert_not_called()
+
+    def test_upload_bytes_recreates_removed_directory(self, storage, temp_dir):
+        """upload_bytes should recover if a known directory was removed externally."""
+        storage.upload_bytes(b"a", "reports/a.md")
+        shutil.rmtree(temp_dir / "reports")
+
+        storage.upload_bytes(b"b", "reports/b.md")
+
+        assert (temp_dir / "reports/b.md").read_bytes() == b"b"
+
     def test_upload_file(self, storage, temp_dir):
         """upload_file should copy file to storage."""
         # Create source file
@@ -60,6 +80,45 @@ class TestLocalStorageBackend:
         assert (temp_dir / "copied/file.txt").exists()
         assert (temp_dir / "copied/file.txt").read_text() == "source content"
 
+    def test_upload_file_same_file(self, storage, temp_dir):
+        """upload_file should leave a file already at its destination untouched."""
+        (temp_dir / "reports").mkdir()
+        source = temp_dir / "reports/test.pdf"
+        source.write_bytes(b"pdf")
+
+        result = storage.upload_file(temp_dir / "reports/../reports/test.pdf", "reports/test.pdf")
+
+        assert result == str(source)
+        assert source.read_bytes() == b"pdf"
+
+    def test_upload_file_falls_back_to_copy2(self, storage, temp_dir):
+        """upload_file should still copy when copy_file_range is refused."""
+        source = temp_dir / "source.txt"
+        source.write_text("source content")
+
+        with mock.patch(
+            "tradingagents.storage.backends.local.os.copy_file_range",
+            side_effect=OSError("unsupported"),
+            create=True,
+        ):
+            storage.upload_file(source, "copied/file.txt")
+
+        assert (temp_dir / "copied/file.txt").read_text() == "source content"
+
+    def test_upload_file_falls_back_on_short_copy(self, storage, temp_dir):
+        """upload_file should copy everything when copy_file_range stops early."""
+        source = temp_dir / "source.txt"
+        source.write_text("source content")
+
+        with mock.patch(
+            "tradingagents.storage.backends.local.os.copy_file_range",
+            return_value=0,
+            create=True,
+        ):
+            storage.upload_file(source, "copied/file.txt")
+
+        assert (temp_dir / "copied/file.txt").read_text() == "source content"
+
     def test_get_url_exists(self, storage, temp_dir):
         """get_url should return path for existing file."""
         (temp_dir / "test.md").write_text("content")
@@ -68,6 +127,18 @@ class TestLocalStorageBackend:
 
         assert result == str(temp_dir / "test.md")
 
+    def test_get_url_after_upload_skips_stat(self, storage, temp_dir):
+        """get_url should not stat a key this backend just wrote."""
+        storage.upload_bytes(b"content", "reports/test.md")
+
+        with mock.patch(
+            "tradingagents.storage.backends.local.os.path.exists"
+        ) as path_exists:
+            result = storage.get_url("reports/test.md")
+
+        path_exists.assert_not_called()
+        assert result == str(temp_dir / "reports/test.md")
+
     def test_get_url_not_exists(self, storage):
         """get_url should return None for non-existent file."""
         result = storage.get_url("nonexistent.md")
@@ -83,6 +154,30 @@ class TestLocalStorageBackend:
         """exists should return False for non-existent file."""
         assert storage.exists("nonexistent.md") is False
 
+    def test_exists_cached_until_invalidated(self, storage, temp_dir):
+        """exists should reuse its result until the key is invalidated."""
+        assert storage.exists("test.md") is False
+        (temp_dir / "test.md").write_text("content")
+        assert storage.exists("test.md") is False
+
+        storage.invalidate("test.md")
+
+        assert storage.exists("test.md") is True
+
+    def test_exists_cache_updated_by_writes(self, storage):
+        """Uploads and deletes through the backend should update exists."""
+        assert storage.exists("test.md") is False
+        storage.upload_bytes(b"content", "test.md")
+        assert storage.exists("test.md") is True
+        storage.delete("test.md")
+        assert storage.exists("test.md") is False
+
+    def test_delete_directory_clears_cached_keys(self, storage):
+        """Deleting a directory should forget cached keys beneath it."""
+        storage.upload_bytes(b"content", "reports/test.md")
+        storage.delete("reports")
+        assert storage.exists("reports/test.md") is False
+
     def test_delete_existing_file(self, storage, temp_dir):
         """delete should remove existing file."""
         (temp_dir / "test.md").write_text("content")
@@ -107,6 +202,16 @@ class TestLocalStorageBackend:
         assert result is True
         assert not (temp_dir / "reports").exists()
 
+    def test_delete_many(self, storage, temp_dir):
+        """delete_many should delete each key and report per-key results."""
+        (temp_dir / "a.md").write_text("a")
+        (temp_dir / "b.md").write_text("b")
+
+        result = storage.delete_many(["a.md", "b.md", "missing.md"])
+
+        assert result == {"a.md": True, "b.md": True, "missing.md": False}
+        assert not (temp_dir / "a.md").exists()
+
     def test_list_files_directory(self, storage, temp_dir):
         """list_files should list files in directory."""
         (temp_dir / "reports").mkdir()
@@ -127,6 +232,15 @@ class TestLocalStorageBackend:
 
         assert sorted(result) == ["reports/a.md", "reports/sub/b.md"]
 
+    def test_list_files_trailing_slash(self, storage, temp_dir):
+        """list_files should accept an S3-style prefix ending in a slash."""
+        (temp_dir / "reports/sub").mkdir(parents=True)
+        (temp_dir / "reports/sub/b.md").write_text("b")
+
+        result = storage.list_files("reports/")
+
+        assert result == ["reports/sub/b.md"]
+
     def test_list_files_single_file(self, storage, temp_dir):
         """list_files should return single file if prefix is a file."""
         (temp_dir / "test.md").write_text("content")
@@ -4,9 +4,10 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
+from botocore.exceptions import ClientError
 
 from tradingagents.config import R2StorageConfig
-from tradingagents.storage.backends.r2 import R2StorageBackend
+from tradingagents.storage.backends.r2 import MULTIPART_CHUNK_SIZE, R2StorageBackend
 
 
 class TestR2StorageBackend:
@@ -51,6 +52,37 @@ class TestR2StorageBackend:
         backend = R2StorageBackend(r2_config)
         assert backend._client is None
 
+    def test_warm_up_builds_client(self, r2_config):
+        """warm_up should build the client so later calls reuse it."""
+        backend = R2StorageBackend(r2_config)
+
+        with mock.patch("boto3.client") as client_factory:
+            backend.warm_up()
+            client = backend.client
+
+        client_factory.assert_called_once()
+        assert client is client_factory.return_value
+
+    def test_warm_up_swallows_errors(self, r2_config):
+        """warm_up should not raise if the client cannot be built."""
+        backend = R2StorageBackend(r2_config)
+
+        with mock.patch("boto3.client", side_effect=RuntimeError("boom")):
+            backend.warm_up()
+
+        assert backend._client is None
+
+    def test_client_connection_settings(self, r2_config):
+        """Client should be built with a larger keep-alive connection pool."""
+        backend = R2StorageBackend(r2_config)
+
+        with mock.patch("boto3.client") as client_factory:
+            backend.client
+
+        config = client_factory.call_args.kwargs["config"]
+        assert config.max_pool_connections == 50
+        assert config.tcp_keepalive is True
+
     def test_upload_bytes(self, backend_with_mock):
         """upload_bytes should call put_object."""
         backend, mock_client = backend_with_mock
@@ -78,6 +110,31 @@ class TestR2StorageBackend:
         call_args = mock_client.put_object.call_args
         assert call_args.kwargs["ContentType"] == "application/pdf"
 
+    def test_upload_bytes_content_encoding(self, backend_with_mock):
+        """upload_bytes should forward content_encoding as ContentEncoding."""
+        backend, mock_client = backend_with_mock
+
+        backend.upload_bytes(b"gz", "reports/test.md", content_encoding="gzip")
+
+        call_args = mock_client.put_object.call_args
+        assert call_args.kwargs["ContentEncoding"] == "gzip"
+        assert call_args.kwargs["ContentType"] == "text/markdown"
+
+    def test_upload_bytes_large_uses_multipart(self, backend_with_mock):
+        """upload_bytes should use a managed upload above the multipart size."""
+        backend, mock_client = backend_with_mock
+        data = b"x" * (MULTIPART_CHUNK_SIZE + 1)
+
+        backend.upload_bytes(data, "reports/bundle.pdf")
+
+        mock_client.put_object.assert_not_called()
+        mock_client.upload_fileobj.assert_called_once()
+        call_args = mock_client.upload_fileobj.call_args
+        assert call_args.args[0].getvalue() == data
+        assert call_args.args[1:] == ("test-bucket", "reports/bundle.pdf")
+        assert call_args.kwargs["ExtraArgs"] == {"ContentType": "application/pdf"}
+        assert call_args.kwargs["Config"] is backend.transfer_config
+
     def test_upload_file(self, backend_with_mock, tmp_path):
         """upload_file should call upload_file on client."""
         backend, mock_client = backend_with_mock
@@ -97,6 +154,7 @@ class TestR2StorageBackend:
         assert call_args.args[0] == str(test_file)
         assert call_args.args[1] == "test-bucket"
         assert call_args.args[2] == "reports/test.md"
+        assert call_args.kwargs["Config"].multipart_chunksize == MULTIPART_CHUNK_SIZE
         assert result == "r2://test-bucket/reports/test.md"
 
     def test_get_url(self, backend_with_mock):
@@ -123,6 +181,32 @@ class TestR2StorageBackend:
         call_args = mock_client.generate_presigned_url.call_args
         assert call_args.kwargs["ExpiresIn"] == 3600
 
+    def test_get_url_cached(self, backend_with_mock):
+        """get_url should reuse a presigned URL for the same key and expiry."""
+        backend, mock_client = backend_with_mock
+        mock_client.generate_presigned_url.side_effect = ["https://a", "https://b"]
+
+        first = backend.get_url("reports/test.md", expires_in=600)
+        second = backend.get_url("reports/test.md", expires_in=600)
+        other_expiry = backend.get_url("reports/test.md", expires_in=1200)
+
+        assert first == second == "https://a"
+        assert other_expiry == "https://b"
+        assert mock_client.generate_presigned_url.call_count == 2
+
+    def test_get_url_cache_expires_at_half_lifetime(self, backend_with_mock):
+        """A cached presigned URL should be re-signed after half its lifetime."""
+        backend, mock_client = backend_with_mock
+        mock_client.generate_presigned_url.side_effect = ["https://a", "https://b"]
+
+        with mock.patch("tradingagents.storage.cache.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            backend.get_url("reports/test.md", expires_in=600)
+            clock.return_value = 1301.0
+            result = backend.get_url("reports/test.md", expires_in=600)
+
+        assert result == "https://b"
+
     def test_get_url_error_returns_none(self, backend_with_mock):
         """get_url should return None on error."""
         backend, mock_client = backend_with_mock
@@ -183,6 +267,55 @@ class TestR2StorageBackend:
 
         assert result is False
 
+    def test_exists_false_on_404(self, backend_with_mock):
+        """exists should return False and cache it for a 404 ClientError."""
+        backend, mock_client = backend_with_mock
+        mock_client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+        )
+
+        assert backend.exists("reports/test.md") is False
+        assert backend.exists("reports/test.md") is False
+
+        mock_client.head_object.assert_called_once()
+
+    def test_exists_other_client_error_not_cached(self, backend_with_mock):
+        """Non-404 errors should return False without poisoning the cache."""
+        backend, mock_client = backend_with_mock
+        mock_client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "403", "Message": "Forbidden"}}, "HeadObject"
+        )
+
+        assert backend.exists("reports/test.md") is False
+
+        mock_client.head_object.side_effect = None
+        assert backend.exists("reports/test.md") is True
+
+    def test_exists_cached(self, backend_with_mock):
+        """exists should not repeat the HEAD request for a cached key."""
+        backend, mock_client = backend_with_mock
+
+        assert backend.exists("reports/test.md") is True
+        assert backend.exists("reports/test.md") is True
+
+        mock_client.head_object.assert_called_once()
+
+        backend.invalidate("reports/test.md")
+        backend.exists("reports/test.md")
+
+        assert mock_client.head_object.call_count == 2
+
+    def test_exists_after_upload_and_delete(self, backend_with_mock):
+        """Uploads and deletes should update the exists cache."""
+        backend, mock_client = backend_with_mock
+
+        backend.upload_bytes(b"test", "reports/test.md")
+        assert backend.exists("reports/test.md") is True
+        backend.delete("reports/test.md")
+        assert backend.exists("reports/test.md") is False
+
+        mock_client.head_object.assert_not_called()
+
     def test_delete(self, backend_with_mock):
         """delete should call delete_object."""
         backend, mock_client = backend_with_mock
@@ -204,20 +337,57 @@ class TestR2StorageBackend:
 
         assert result is False
 
+    def test_delete_many_batches_requests(self, backend_with_mock):
+        """delete_many should send at most 1000 keys per delete_objects call."""
+        backend, mock_client = backend_with_mock
+        keys = [f"reports/{i}.md" for i in range(1500)]
+        mock_client.delete_objects.side_effect = [
+            {"Errors": [{"Key": "reports/3.md", "Code": "AccessDenied"}]},
+            {},
+        ]
+
+        result = backend.delete_many(keys)
+
+        assert mock_client.delete_objects.call_count == 2
+        first, second = mock_client.delete_objects.call_args_list
+        assert len(first.kwargs["Delete"]["Objects"]) == 1000
+        assert second.kwargs["Delete"]["Objects"][0] == {"Key": "reports/1000.md"}
+        assert first.kwargs["Delete"]["Quiet"] is True
+        assert result["reports/3.md"] is False
+        assert sum(result.values()) == 1499
+        assert backend.exists("reports/1499.md") is False
+        mock_client.head_object.assert_not_called()
+
+    def test_delete_many_request_error(self, backend_with_mock):
+        """delete_many should mark a failed batch as not deleted."""
+        backend, mock_client = backend_with_mock
+        mock_client.delete_objects.side_effect = Exception("Error")
+
+        result = backend.delete_many(["a.md", "b.md"])
+
+        assert result == {"a.md": False, "b.md": False}
+
     def test_list_files(self, backend_with_mock):
         """list_files should paginate through objects."""
         backend, mock_client = backend_with_mock
 
         paginator = mock.MagicMock()
-        paginator.paginate.return_value = [
-            {"Contents": [{"Key": "prefix/a.md"}, {"Key": "prefix/b.md"}]},
-            {"Contents": [{"Key": "prefix/c.md"}]},
-        ]
+        paginator.paginate.return_value.search.return_value = iter(
+            ["prefix/a.md", "prefix/b.md", "prefix/c.md"]
+        )
         mock_client.get_paginator.return_value = paginator
 
         result = backend.list_files("prefix/")
 
         mock_client.get_paginator.assert_called_once_with("list_objects_v2")
+        paginator.paginate.assert_called_once_with(
+            Bucket="test-bucket",
+            Prefix="prefix/",
+            PaginationConfig={"PageSize": 1000},
+        )
+        paginator.paginate.return_value.search.assert_called_once_with(
+            "Contents[].Key"
+        )
         assert result == ["prefix/a.md", "prefix/b.md", "prefix/c.md"]
 
     def test_list_files_empty(self, backend_with_mock):
@@ -225,7 +395,8 @@ class TestR2StorageBackend:
         backend, mock_client = backend_with_mock
 
         paginator = mock.MagicMock()
-        paginator.paginate.return_value = [{}]
+        # botocore yields None for a page with no Contents
+        paginator.paginate.return_value.search.return_value = iter([None])
         mock_client.get_paginator.return_value = paginator
 
         result = backend.list_files("prefix/")
@@ -1,6 +1,10 @@
 """Tests for storage service."""
 
+import gzip
+import io
+import tarfile
 import tempfile
+import threading
 from pathlib import Path
 from unittest import mock
 
@@ -99,6 +103,16 @@ class TestStorageService:
         assert results["local"] is True
         assert not (temp_dir / "report.md").exists()
 
+    def test_delete_many(self, local_service, temp_dir):
+        """delete_many should remove every key from all backends."""
+        (temp_dir / "a.md").write_text("a")
+        (temp_dir / "b.md").write_text("b")
+
+        results = local_service.delete_many(["a.md", "b.md"])
+
+        assert results == {"local": {"a.md": True, "b.md": True}}
+        assert not (temp_dir / "b.md").exists()
+
     def test_list_reports(self, local_service, temp_dir):
         """list_reports should list from all backends."""
         (temp_dir / "prefix").mkdir()
@@ -126,6 +140,26 @@ class TestStorageService:
             # Should return empty dict, not raise
             assert results == {}
 
+    def test_upload_report_batch_local_files(self, local_service, temp_dir):
+        """upload_report_batch should write each report locally."""
+        results = local_service.upload_report_batch(
+            [("AAPL/a.md", "# A"), ("AAPL/b.md", "# B")]
+        )
+
+        assert results["local"] == [
+            str(temp_dir / "AAPL/a.md"),
+            str(temp_dir / "AAPL/b.md"),
+        ]
+        assert (temp_dir / "AAPL/b.md").read_text() == "# B"
+
+    def test_context_manager_closes_executor(self, local_config):
+        """Leaving the context should shut down the worker threads."""
+        with StorageService(local_config) as service:
+            service.upload_report("# Test", "report.md")
+
+        with pytest.raises(RuntimeError):
+            service.upload_report("# Test", "report.md")
+
     def test_multiple_reports_upload(self, local_service, temp_dir):
         """Multiple reports should be uploadable."""
         reports = {
@@ -187,6 +221,17 @@ class TestStorageServiceWithR2:
             assert results["r2"] == "r2://test-bucket/report.md"
             assert (temp_dir / "report.md").exists()
 
+    def test_r2_client_warmed_in_background(self, r2_config):
+        """The R2 client should be warmed on a background thread at startup."""
+        warmed = threading.Event()
+
+        with mock.patch(
+            "tradingagents.storage.backends.r2.R2StorageBackend.warm_up",
+            side_effect=warmed.set,
+        ):
+            StorageService(r2_config)
+            assert warmed.wait(timeout=5)
+
     def test_r2_primary_for_url(self, r2_config):
         """get_report_url should use R2 backend when available."""
         service = StorageService(r2_config)
@@ -200,6 +245,99 @@ class TestStorageServiceWithR2:
 
             assert url == "https://presigned.url"
 
+    def test_backends_called_concurrently(self, r2_config):
+        """Uploads to different backends should overlap in time."""
+        service = StorageService(r2_config)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_other_backend(*args):
+            barrier.wait()
+            return "ok"
+
+        with mock.patch.object(
+            service._backends["local"], "upload_bytes", side_effect=wait_for_other_backend
+        ), mock.patch.object(
+            service._backends["r2"], "upload_bytes", side_effect=wait_for_other_backend
+        ):
+            results = service.upload_report("# Test", "report.md")
+
+        assert results == {"local": "ok", "r2": "ok"}
+
+    def test_upload_report_gzips_text_for_r2(self, r2_config, temp_dir):
+        """upload_report should send R2 gzipped text and keep local files plain."""
+        service = StorageService(r2_config)
+        content = "# Report\n" + "Revenue grew steadily. " * 200
+
+        with mock.patch.object(
+            service._backends["r2"], "upload_bytes", return_value="r2://x"
+        ) as r2_upload:
+            service.upload_report(content, "AAPL/report.md")
+
+        data, key, content_type = r2_upload.call_args.args
+        assert gzip.decompress(data) == content.encode("utf-8")
+        assert key == "AAPL/report.md"
+        assert content_type == "text/markdown"
+        assert r2_upload.call_args.kwargs == {"content_encoding": "gzip"}
+        assert (temp_dir / "AAPL/report.md").read_text() == content
+
+    def test_upload_report_skips_gzip_when_not_smaller(self, r2_config):
+        """upload_report should send raw bytes when gzip does not pay off."""
+        service = StorageService(r2_config)
+
+        with mock.patch.object(
+            service._backends["r2"], "upload_bytes", return_value="r2://x"
+        ) as r2_upload:
+            service.upload_report("# Hi", "report.md")
+
+        assert r2_upload.call_args.args == (b"# Hi", "report.md", "text/markdown")
+        assert r2_upload.call_args.kwargs == {}
+
+    def test_upload_report_stream_yields_fastest_first(self, r2_config):
+        """upload_report_stream should yield each backend as soon as it finishes."""
+        service = StorageService(r2_config)
+        release_r2 = threading.Event()
+
+        def slow_r2(*args):
+            release_r2.wait(timeout=5)
+            raise Exception("R2 error")
+
+        with mock.patch.object(
+            service._backends["r2"], "upload_bytes", side_effect=slow_r2
+        ):
+            stream = service.upload_report_stream("# Test", "report.md")
+            first = next(stream)
+            release_r2.set()
+            second = next(stream)
+
+        assert first[0] == "local"
+        assert first[1].endswith("report.md")
+        assert second[0] == "r2"
+        assert isinstance(second[1], Exception)
+
+    def test_upload_report_batch_single_r2_archive(self, r2_config, temp_dir):
+        """upload_report_batch should send R2 one tar.gz holding every report."""
+        service = StorageService(r2_config)
+
+        with mock.patch.object(
+            service._backends["r2"],
+            "upload_bytes",
+            return_value="r2://test-bucket/batches/run1.tar.gz",
+        ) as r2_upload:
+            results = service.upload_report_batch(
+                [("AAPL/a.md", "# A"), ("AAPL/b.md", "# B")], batch_id="run1"
+            )
+
+        r2_upload.assert_called_once()
+        archive, key, content_type = r2_upload.call_args.args
+        assert key == "batches/run1.tar.gz"
+        assert content_type == "application/gzip"
+        with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tar:
+            assert tar.getnames() == ["AAPL/a.md", "AAPL/b.md"]
+            assert tar.extractfile("AAPL/b.md").read() == b"# B"
+
+        assert results["r2"] == ["r2://test-bucket/batches/run1.tar.gz"]
+        assert (temp_dir / "AAPL/a.md").exists()
+
     def test_r2_failure_graceful_degradation(self, r2_config, temp_dir):
         """R2 failure should not prevent local upload."""
         service = StorageService(r2_config)
@@ -1,53 +1,91 @@
 # TradingAgents/graph/conditional_logic.py
 
+import sys
+
 from tradingagents.agents.utils.agent_states import AgentState
 
+# Canonical node names, interned once so graph dispatch compares by identity
+BULL_RESEARCHER = sys.intern("Bull Researcher")
+BEAR_RESEARCHER = sys.intern("Bear Researcher")
+RESEARCH_MANAGER = sys.intern("Research Manager")
+TRADER = sys.intern("Trader")
+RISKY_ANALYST = sys.intern("Risky Analyst")
+SAFE_ANALYST = sys.intern("Safe Analyst")
+NEUTRAL_ANALYST = sys.intern("Neutral Analyst")
+RISK_JUDGE = sys.intern("Risk Judge")
+PORTFOLIO_MANAGER = sys.intern("Portfolio Manager")
+ANALYST_COLLECTOR = sys.intern("Analyst Collector")
+
 
 class ConditionalLogic:
     """Handles conditional logic for determining graph flow."""
 
+    __slots__ = (
+        "max_debate_rounds",
+        "max_risk_discuss_rounds",
+        "_debate_limit",
+        "_risk_limit",
+        "_debate_next",
+        "_risk_next",
+    )
+
+    # (tools node, message-clear node) for each analyst type
+    _ANALYST_ROUTES = {
+        analyst_type: (
+            sys.intern(f"tools_{analyst_type}"),
+            sys.intern(f"Msg Clear {analyst_type.capitalize()}"),
+        )
+        for analyst_type in ("market", "social", "news", "fundamentals")
+    }
+
     def __init__(self, max_debate_rounds=1, max_risk_discuss_rounds=1):
         """Initialize with configuration parameters."""
         self.max_debate_rounds = max_debate_rounds
         self.max_risk_discuss_rounds = max_risk_discuss_rounds
 
-        # Generate analyst router methods dynamically
-        for analyst_type in ["market", "social", "news", "fundamentals"]:
-            setattr(self, f"should_continue_{analyst_type}",
-                    self._create_analyst_router(analyst_type))
+        # Turn limits: 2 speakers per debate round, 3 per risk round
+        self._debate_limit = 2 * max_debate_rounds
+        self._risk_limit = 3 * max_risk_discuss_rounds
 
-    def _create_analyst_router(self, analyst_type: str):
-        """Create a router function for the given analyst type."""
-        tools_key = f"tools_{analyst_type}"
-        clear_key = f"Msg Clear {analyst_type.capitalize()}"
+        # Next-node lookup tables keyed by the first word of the last speaker
+        self._debate_next = {"Bull": BEAR_RESEARCHER}
+        self._risk_next = {"Risky": SAFE_ANALYST, "Safe": NEUTRAL_ANALYST}
 
-        def router(state: AgentState):
-            if state["messages"][-1].tool_calls:
-                return tools_key
-            return clear_key
+    def _route_analyst(self, state: AgentState, analyst_type: str) -> str:
+        """Route an analyst to its tool node or its message-clear node."""
+        tools_key, clear_key = self._ANALYST_ROUTES[analyst_type]
+        if state["messages"][-1].tool_calls:
+            return tools_key
+        return clear_key
 
-        router.__doc__ = f"Determine if {analyst_type} analysis should continue."
-        return router
+    def should_continue_market(self, state: AgentState) -> str:
+        """Determine if market analysis should continue."""
+        return self._route_analyst(state, "market")
+
+    def should_continue_social(self, state: AgentState) -> str:
+        """Determine if social analysis should continue."""
+        return self._route_analyst(state, "social")
+
+    def should_continue_news(self, state: AgentState) -> str:
+        """Determine if news analysis should continue."""
+        return self._route_analyst(state, "news")
+
+    def should_continue_fundamentals(self, state: AgentState) -> str:
+        """Determine if fundamentals analysis should continue."""
+        return self._route_analyst(state, "fundamentals")
 
     def should_continue_debate(self, state: AgentState) -> str:
         """Determine if debate should continue."""
-
-        if (
-            state["investment_debate_state"]["count"] >= 2 * self.max_debate_rounds
-        ):  # 3 rounds of back-and-forth between 2 agents
-            return "Research Manager"
-        if state["investment_debate_state"]["current_response"].startswith("Bull"):
-            return "Bear Researcher"
-        return "Bull Researcher"
+        debate_state = state["investment_debate_state"]
+        if debate_state["count"] >= self._debate_limit:
+            return RESEARCH_MANAGER
+        speaker = debate_state["current_response"].partition(" ")[0]
+        return self._debate_next.get(speaker, BULL_RESEARCHER)
 
     def should_continue_risk_analysis(self, state: AgentState) -> str:
         """Determine if risk analysis should continue."""
-        if (
-            state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds
-        ):  # 3 rounds of back-and-forth between 3 agents
-            return "Risk Judge"
-        if state["risk_debate_state"]["latest_speaker"].startswith("Risky"):
-            return "Safe Analyst"
-        if state["risk_debate_state"]["latest_speaker"].startswith("Safe"):
-            return "Neutral Analyst"
-        return "Risky Analyst"
+        risk_state = state["risk_debate_state"]
+        if risk_state["count"] >= self._risk_limit:
+            return RISK_JUDGE
+        speaker = risk_state["latest_speaker"].partition(" ")[0]
+        return self._risk_next.get(speaker, RISKY_ANALYST)
@@ -1,6 +1,7 @@
 # TradingAgents/graph/setup.py
 
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Tuple
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -30,9 +31,23 @@ from tradingagents.agents.base.portfolio_manager_configs import (
 )
 from tradingagents.agents.utils.agent_states import AgentState
 
-from .conditional_logic import ConditionalLogic
+from .conditional_logic import (
+    ConditionalLogic,
+    BULL_RESEARCHER,
+    BEAR_RESEARCHER,
+    RESEARCH_MANAGER,
+    TRADER,
+    RISKY_ANALYST,
+    SAFE_ANALYST,
+    NEUTRAL_ANALYST,
+    RISK_JUDGE,
+    PORTFOLIO_MANAGER,
+    ANALYST_COLLECTOR,
+)
 from .propagation import analyst_collector_node
 
+DEFAULT_ANALYSTS = ("market", "social", "news", "fundamentals")
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
@@ -64,13 +79,14 @@ class GraphSetup:
         self.portfolio_service = portfolio_service
         self.conditional_logic = conditional_logic
 
-    def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
-    ):
+        # Compiled graphs keyed by the selected analyst tuple
+        self._compiled_cache: Dict[Tuple[str, ...], Any] = {}
+
+    def setup_graph(self, selected_analysts: Tuple[str, ...] = DEFAULT_ANALYSTS):
         """Set up and compile the agent workflow graph.
 
         Args:
-            selected_analysts (list): List of analyst types to include. Options are:
+            selected_analysts (tuple): Analyst types to include. Options are:
                 - "market": Market analyst
                 - "social": Social media analyst
                 - "news": News analyst
@@ -79,19 +95,54 @@ class GraphSetup:
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
 
-        # Create analyst nodes
-        analyst_nodes = {}
-        delete_nodes = {}
-        tool_nodes = {}
+        invalid = [a for a in selected_analysts if a not in DEFAULT_ANALYSTS]
+        if invalid:
+            raise ValueError(
+                f"Trading Agents Graph Setup Error: unknown analysts {invalid}"
+            )
+
+        # De-duplicate while preserving order
+        key = tuple(dict.fromkeys(selected_analysts))
+
+        graph = self._compiled_cache.get(key)
+        if graph is None:
+            graph = self._compile(key)
+            self._compiled_cache[key] = graph
+        return graph
+
+    def _compile(self, selected_analysts: Tuple[str, ...]):
+        """Build and compile the workflow graph for the given analysts."""
+        has_pm = bool(self.portfolio_service)
 
-        # Create analyst nodes using base class factory
+        # Declarative node table: (name, node), and edge table: (source, target)
+        # for plain edges, (source, router, targets) for conditional edges
+        nodes = []
+        edges = []
+
+        # Single pass per analyst: create its nodes, fan out from START,
+        # wire its tool loop and fan in to the collector
+        delete_node = create_msg_delete()
         for analyst_type in selected_analysts:
             config = get_analyst_config(analyst_type)
-            analyst_nodes[analyst_type] = create_analyst_from_config(
-                self.quick_thinking_llm, config
+            analyst_node = create_analyst_from_config(self.quick_thinking_llm, config)
+            current_analyst = sys.intern(f"{analyst_type.capitalize()} Analyst")
+            current_tools = sys.intern(f"tools_{analyst_type}")
+            current_clear = sys.intern(f"Msg Clear {analyst_type.capitalize()}")
+
+            nodes.append((current_analyst, analyst_node))
+            nodes.append((current_clear, delete_node))
+            nodes.append((current_tools, self.tool_nodes[analyst_type]))
+
+            edges.append((START, current_analyst))
+            edges.append(
+                (
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
             )
-            delete_nodes[analyst_type] = create_msg_delete()
-            tool_nodes[analyst_type] = self.tool_nodes[analyst_type]
+            edges.append((current_tools, current_analyst))
+            edges.append((current_clear, ANALYST_COLLECTOR))
 
         # Create researcher nodes using base class factory
         bull_researcher_node = create_researcher_from_config(
@@ -123,119 +174,93 @@ class GraphSetup:
             self.deep_thinking_llm, self.risk_manager_memory, RISK_MANAGER_CONFIG
         )
 
-        # Create portfolio manager node if enabled
-        portfolio_manager_node = None
-        if self.portfolio_service:
+        nodes.extend(
+            [
+                (BULL_RESEARCHER, bull_researcher_node),
+                (BEAR_RESEARCHER, bear_researcher_node),
+                (RESEARCH_MANAGER, research_manager_node),
+                (TRADER, trader_node),
+                (RISKY_ANALYST, risky_analyst),
+                (NEUTRAL_ANALYST, neutral_analyst),
+                (SAFE_ANALYST, safe_analyst),
+                (RISK_JUDGE, risk_manager_node),
+            ]
+        )
+        # Collector node for parallel analyst execution
+        nodes.append((ANALYST_COLLECTOR, analyst_collector_node))
+
+        should_continue_debate = self.conditional_logic.should_continue_debate
+        should_continue_risk = self.conditional_logic.should_continue_risk_analysis
+        edges.extend(
+            [
+                # Collector proceeds to debate phase
+                (ANALYST_COLLECTOR, BULL_RESEARCHER),
+                (
+                    BULL_RESEARCHER,
+                    should_continue_debate,
+                    {
+                        BEAR_RESEARCHER: BEAR_RESEARCHER,
+                        RESEARCH_MANAGER: RESEARCH_MANAGER,
+                    },
+                ),
+                (
+                    BEAR_RESEARCHER,
+                    should_continue_debate,
+                    {
+                        BULL_RESEARCHER: BULL_RESEARCHER,
+                        RESEARCH_MANAGER: RESEARCH_MANAGER,
+                    },
+                ),
+                (RESEARCH_MANAGER, TRADER),
+                (TRADER, RISKY_ANALYST),
+                (
+                    RISKY_ANALYST,
+                    should_continue_risk,
+                    {
+                        SAFE_ANALYST: SAFE_ANALYST,
+                        RISK_JUDGE: RISK_JUDGE,
+                    },
+                ),
+                (
+                    SAFE_ANALYST,
+                    should_continue_risk,
+                    {
+                        NEUTRAL_ANALYST: NEUTRAL_ANALYST,
+                        RISK_JUDGE: RISK_JUDGE,
+                    },
+                ),
+                (
+                    NEUTRAL_ANALYST,
+                    should_continue_risk,
+                    {
+                        RISKY_ANALYST: RISKY_ANALYST,
+                        RISK_JUDGE: RISK_JUDGE,
+                    },
+                ),
+            ]
+        )
+
+        # Risk Judge goes to Portfolio Manager (if enabled) or END
+        edges.append((RISK_JUDGE, PORTFOLIO_MANAGER if has_pm else END))
+        if has_pm:
             portfolio_manager_node = create_portfolio_manager_from_config(
                 self.deep_thinking_llm,
                 self.portfolio_manager_memory or self.invest_judge_memory,
                 PORTFOLIO_MANAGER_CONFIG,
                 self.portfolio_service,
             )
+            nodes.append((PORTFOLIO_MANAGER, portfolio_manager_node))
+            edges.append((PORTFOLIO_MANAGER, END))
 
-        # Create workflow
+        # Build the workflow in a single pass over the tables
         workflow = StateGraph(AgentState)
-
-        # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
-
-        # Add other nodes
-        workflow.add_node("Bull Researcher", bull_researcher_node)
-        workflow.add_node("Bear Researcher", bear_researcher_node)
-        workflow.add_node("Research Manager", research_manager_node)
-        workflow.add_node("Trader", trader_node)
-        workflow.add_node("Risky Analyst", risky_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Safe Analyst", safe_analyst)
-        workflow.add_node("Risk Judge", risk_manager_node)
-
-        # Add portfolio manager node if enabled
-        if portfolio_manager_node:
-            workflow.add_node("Portfolio Manager", portfolio_manager_node)
-
-        # Add collector node for parallel analyst execution
-        workflow.add_node("Analyst Collector", analyst_collector_node)
-
-        # Define edges - Parallel analyst execution
-        # Fan-out: START -> all analysts simultaneously
-        for analyst_type in selected_analysts:
-            workflow.add_edge(START, f"{analyst_type.capitalize()} Analyst")
-
-        # Set up each analyst's tool loop and fan-in to collector
-        for analyst_type in selected_analysts:
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst's tool loop
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
-
-            # Fan-in: all analysts -> Collector
-            workflow.add_edge(current_clear, "Analyst Collector")
-
-        # Collector proceeds to debate phase
-        workflow.add_edge("Analyst Collector", "Bull Researcher")
-
-        # Add remaining edges
-        workflow.add_conditional_edges(
-            "Bull Researcher",
-            self.conditional_logic.should_continue_debate,
-            {
-                "Bear Researcher": "Bear Researcher",
-                "Research Manager": "Research Manager",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Bear Researcher",
-            self.conditional_logic.should_continue_debate,
-            {
-                "Bull Researcher": "Bull Researcher",
-                "Research Manager": "Research Manager",
-            },
-        )
-        workflow.add_edge("Research Manager", "Trader")
-        workflow.add_edge("Trader", "Risky Analyst")
-        workflow.add_conditional_edges(
-            "Risky Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Safe Analyst": "Safe Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Safe Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Neutral Analyst": "Neutral Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Neutral Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Risky Analyst": "Risky Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
-
-        # Risk Judge goes to Portfolio Manager (if enabled) or END
-        if portfolio_manager_node:
-            workflow.add_edge("Risk Judge", "Portfolio Manager")
-            workflow.add_edge("Portfolio Manager", END)
-        else:
-            workflow.add_edge("Risk Judge", END)
+        for name, node in nodes:
+            workflow.add_node(name, node)
+        for edge in edges:
+            if len(edge) == 3:
+                workflow.add_conditional_edges(*edge)
+            else:
+                workflow.add_edge(*edge)
 
         # Compile and return
         return workflow.compile()
@@ -52,14 +52,14 @@ class TradingAgentsGraph:
 
     def __init__(
         self,
-        selected_analysts=["market", "social", "news", "fundamentals"],
+        selected_analysts=("market", "social", "news", "fundamentals"),
         debug=False,
         config: Union[TradingAgentsConfig, Dict[str, Any], None] = None,
     ):
         """Initialize the trading agents graph and components.
 
         Args:
-            selected_analysts: List of analyst types to include
+            selected_analysts: Analyst types to include
             debug: Whether to run in debug mode
             config: Configuration (TradingAgentsConfig or legacy dict). If None, uses default.
         """
@@ -2,12 +2,17 @@
 
 import logging
 import os
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger for the given module name.
 
+    Results are memoized per name; prefer a module-level
+    ``logger = get_logger(__name__)`` over calling this in hot paths.
+
     Args:
         name: Module name (typically __name__)
 
@@ -24,16 +29,18 @@ def setup_logging(level: Optional[str] = None) -> None:
         level: Log level (DEBUG, INFO, WARNING, ERROR).
                Defaults to LOG_LEVEL env var or INFO.
     """
-    level = level or os.getenv("LOG_LEVEL", "INFO")
+    log_level = getattr(
+        logging, (level or os.getenv("LOG_LEVEL", "INFO")).upper(), logging.INFO
+    )
 
-    # Configure root logger for tradingagents
+    # Configure root logger for tradingagents. force=True replaces any
+    # handlers from a previous call so repeated setup actually reconfigures.
     logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
+        level=log_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
+        force=True,
     )
 
     # Set tradingagents logger level
-    logging.getLogger("tradingagents").setLevel(
-        getattr(logging, level.upper(), logging.INFO)
-    )
+    logging.getLogger("tradingagents").setLevel(log_level)
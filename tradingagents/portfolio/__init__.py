@@ -4,12 +4,20 @@ This module provides functionality for tracking portfolio state,
 positions, and transactions using Google Sheets as the data store.
 """
 
-from tradingagents.portfolio.models import Position, Transaction, PortfolioSummary
+from tradingagents.portfolio.models import (
+    Position,
+    PositionArray,
+    Transaction,
+    TransactionLog,
+    PortfolioSummary,
+)
 from tradingagents.portfolio.google_sheets import GoogleSheetsPortfolio
 
 __all__ = [
     "Position",
+    "PositionArray",
     "Transaction",
+    "TransactionLog",
     "PortfolioSummary",
     "GoogleSheetsPortfolio",
 ]
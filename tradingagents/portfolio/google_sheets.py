@@ -6,14 +6,48 @@ to Google Sheets, allowing for easy portfolio tracking and management.
 
 import json
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import logging
 
-from tradingagents.portfolio.models import Position, Transaction, PortfolioSummary
+import numpy as np
+
+from tradingagents.portfolio.models import (
+    Position,
+    PositionArray,
+    Transaction,
+    TransactionLog,
+    PortfolioSummary,
+)
 
 logger = logging.getLogger(__name__)
 
+_POSITION_HEADERS = [
+    "Ticker", "Shares", "Avg Cost", "Current Price", "Market Value", "Unrealized P&L", "% of Portfolio"
+]
+_TRANSACTION_HEADERS = ["Date", "Ticker", "Type", "Shares", "Price", "Fees", "Total", "Notes"]
+
+
+# Summary sheet keys whose values are parsed as floats
+_NUMERIC_SUMMARY_KEYS = frozenset(
+    {"total_value", "cash_balance", "daily_pnl", "overall_pnl"}
+)
+
+
+def _format_numbers(values: np.ndarray) -> List[str]:
+    """Format a numeric column for the sheets without losing precision.
+
+    Uses the shortest repr that parses back to the same float, so sub-cent
+    prices and fractional shares survive a save and load unchanged.
+    """
+    return list(map(str, values.tolist()))
+
+
+def _is_query_of(formula: str, sheet: str) -> bool:
+    """Check whether a cell formula is a QUERY over the given sheet."""
+    compact = formula.replace(" ", "").upper()
+    return compact.startswith(f"=QUERY({sheet.upper()}!")
+
 
 class GoogleSheetsPortfolio:
     """Service for managing portfolio data in Google Sheets."""
@@ -23,6 +57,20 @@ class GoogleSheetsPortfolio:
     SHEET_TRANSACTIONS = "Transactions"
     SHEET_SUMMARY = "Summary"
 
+    # Hidden sheets holding the rows as written. The visible Positions and
+    # Transactions sheets show them through a QUERY formula, so Sheets keeps
+    # them ordered and neither reads nor writes need to sort in Python.
+    SHEET_POSITIONS_RAW = "Positions_raw"
+    SHEET_TRANSACTIONS_RAW = "Transactions_raw"
+    POSITIONS_QUERY = (
+        f'=QUERY({SHEET_POSITIONS_RAW}!A2:G, '
+        '"select * where A is not null order by E desc", 0)'
+    )
+    TRANSACTIONS_QUERY = (
+        f'=QUERY({SHEET_TRANSACTIONS_RAW}!A2:H, '
+        '"select * where A is not null order by A desc", 0)'
+    )
+
     def __init__(
         self,
         sheet_id: str,
@@ -54,8 +102,11 @@ class GoogleSheetsPortfolio:
     def _create_service(self):
         """Create the Google Sheets API service."""
         try:
+            import httplib2
             from google.oauth2 import service_account
+            from google_auth_httplib2 import AuthorizedHttp
             from googleapiclient.discovery import build
+            from googleapiclient.errors import UnknownApiNameOrVersion
 
             # Check if credentials file exists
             if not os.path.exists(self.credentials_path):
@@ -70,8 +121,22 @@ class GoogleSheetsPortfolio:
                 scopes=["https://www.googleapis.com/auth/spreadsheets"],
             )
 
-            # Build the service
-            service = build("sheets", "v4", credentials=credentials)
+            # Build the service on a single persistent connection so every
+            # request after the first reuses the same keep-alive TLS socket.
+            http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=60))
+            try:
+                # Use the discovery document bundled with googleapiclient,
+                # avoiding an HTTP fetch on every cold start
+                service = build(
+                    "sheets",
+                    "v4",
+                    http=http,
+                    cache_discovery=False,
+                    static_discovery=True,
+                )
+            except UnknownApiNameOrVersion:
+                logger.debug("Bundled Sheets discovery document unavailable, fetching online")
+                service = build("sheets", "v4", http=http, static_discovery=False)
             logger.info(f"Connected to Google Sheets: {self.sheet_name}")
             return service
 
@@ -81,81 +146,136 @@ class GoogleSheetsPortfolio:
                 "Install with: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib"
             ) from e
 
-    def _get_sheet_data(self, range_name: str) -> List[List[str]]:
-        """Get data from a sheet range.
+    def _batch_get_sheet_data(
+        self, range_names: List[str], value_render_option: Optional[str] = None
+    ) -> List[List[List[str]]]:
+        """Get data from several sheet ranges in a single request.
 
         Args:
-            range_name: The range to read (e.g., "Positions!A1:G100")
+            range_names: The ranges to read
+            value_render_option: How values are rendered, e.g. "FORMULA".
+                Defaults to the API's formatted values.
 
         Returns:
-            List of rows (each row is a list of values)
+            List of row lists, one per requested range, in request order
         """
+        kwargs = {}
+        if value_render_option is not None:
+            kwargs["valueRenderOption"] = value_render_option
         try:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=self.sheet_id, range=range_name)
+                .batchGet(spreadsheetId=self.sheet_id, ranges=range_names, **kwargs)
                 .execute()
             )
-            return result.get("values", [])
+            return [
+                value_range.get("values", [])
+                for value_range in result.get("valueRanges", [])
+            ]
         except Exception as e:
-            logger.error(f"Error reading sheet {range_name}: {e}")
+            logger.error(f"Error reading sheet ranges {range_names}: {e}")
             raise
 
-    def _update_sheet_data(
-        self, range_name: str, values: List[List[str]]
+    def _batch_update_sheet_data(
+        self, updates: List[Tuple[str, List[List[str]]]]
     ) -> Dict[str, Any]:
-        """Update data in a sheet range.
+        """Update several sheet ranges in a single request.
 
         Args:
-            range_name: The range to update
-            values: The values to write
+            updates: (range, values) pairs to write
 
         Returns:
             API response
         """
         try:
-            body = {"values": values}
+            body = {
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {"range": range_name, "values": values}
+                    for range_name, values in updates
+                ],
+            }
             result = (
                 self.service.spreadsheets()
                 .values()
-                .update(
-                    spreadsheetId=self.sheet_id,
-                    range=range_name,
-                    valueInputOption="USER_ENTERED",
-                    body=body,
-                )
+                .batchUpdate(spreadsheetId=self.sheet_id, body=body)
                 .execute()
             )
             return result
         except Exception as e:
-            logger.error(f"Error writing to sheet {range_name}: {e}")
+            ranges = [range_name for range_name, _ in updates]
+            logger.error(f"Error writing to sheet ranges {ranges}: {e}")
             raise
 
-    def _ensure_sheets_exist(self):
-        """Ensure all required sheets exist in the spreadsheet."""
-        try:
-            # Get spreadsheet metadata
-            spreadsheet = (
-                self.service.spreadsheets()
-                .get(spreadsheetId=self.sheet_id)
-                .execute()
-            )
+    def _ensure_sheets_exist(
+        self, range_names: List[str]
+    ) -> Dict[str, Optional[List[List[str]]]]:
+        """Ensure all required sheets exist and read the given ranges.
 
-            existing_sheets = [
-                sheet["properties"]["title"]
-                for sheet in spreadsheet.get("sheets", [])
-            ]
+        Sheet metadata and the range values come back from a single
+        spreadsheets.get call. With ranges the API only returns the sheets
+        they touch, so a one-cell range is added for every required sheet
+        not covered by range_names; values are None for those. The API
+        rejects ranges on sheets that do not exist yet, so on failure only
+        the metadata is fetched; values are then None for sheets that
+        already existed.
+
+        Args:
+            range_names: Ranges to read, at most one per sheet
+
+        Returns:
+            Mapping of sheet title to the rows read from its range, for every
+            sheet that exists. Sheets that could not be created are absent.
+        """
+        required_sheets = [
+            self.SHEET_POSITIONS,
+            self.SHEET_TRANSACTIONS,
+            self.SHEET_SUMMARY,
+            self.SHEET_POSITIONS_RAW,
+            self.SHEET_TRANSACTIONS_RAW,
+        ]
+        covered = {range_name.split("!")[0] for range_name in range_names}
+        probe_only = [title for title in required_sheets if title not in covered]
+
+        values: Dict[str, Optional[List[List[str]]]] = {}
+        try:
+            try:
+                spreadsheet = (
+                    self.service.spreadsheets()
+                    .get(
+                        spreadsheetId=self.sheet_id,
+                        ranges=range_names + [f"{title}!A1" for title in probe_only],
+                        includeGridData=True,
+                        fields="sheets(properties.title,data.rowData.values.formattedValue)",
+                    )
+                    .execute()
+                )
+                for sheet in spreadsheet.get("sheets", []):
+                    rows = []
+                    for grid in sheet.get("data", []):
+                        for row in grid.get("rowData", []):
+                            cells = [
+                                cell.get("formattedValue", "")
+                                for cell in row.get("values", [])
+                            ]
+                            if any(cells):
+                                rows.append(cells)
+                    title = sheet["properties"]["title"]
+                    values[title] = None if title in probe_only else rows
+            except Exception as e:
+                logger.debug(f"Combined sheet probe failed, reading metadata only: {e}")
+                spreadsheet = (
+                    self.service.spreadsheets()
+                    .get(spreadsheetId=self.sheet_id, fields="sheets.properties.title")
+                    .execute()
+                )
+                for sheet in spreadsheet.get("sheets", []):
+                    values[sheet["properties"]["title"]] = None
 
             # Check which sheets are missing
-            required_sheets = [
-                self.SHEET_POSITIONS,
-                self.SHEET_TRANSACTIONS,
-                self.SHEET_SUMMARY,
-            ]
-            missing_sheets = [
-                s for s in required_sheets if s not in existing_sheets
-            ]
+            raw_sheets = {self.SHEET_POSITIONS_RAW, self.SHEET_TRANSACTIONS_RAW}
+            missing_sheets = [s for s in required_sheets if s not in values]
 
             if missing_sheets:
                 logger.info(f"Creating missing sheets: {missing_sheets}")
@@ -165,64 +285,153 @@ class GoogleSheetsPortfolio:
                         "addSheet": {
                             "properties": {
                                 "title": sheet_name,
+                                "hidden": sheet_name in raw_sheets,
                                 "gridProperties": {"rowCount": 1000, "columnCount": 20},
                             }
                         }
                     }
                     for sheet_name in missing_sheets
                 ]
-
-                if requests:
-                    self.service.spreadsheets().batchUpdate(
-                        spreadsheetId=self.sheet_id, body={"requests": requests}
-                    ).execute()
+                # Applied atomically: either every sheet is added or none is
+                self.service.spreadsheets().batchUpdate(
+                    spreadsheetId=self.sheet_id, body={"requests": requests}
+                ).execute()
+                for sheet_name in missing_sheets:
+                    values[sheet_name] = []
 
         except Exception as e:
             logger.warning(f"Could not verify sheets exist: {e}")
 
+        return values
+
     def initialize_sheets(self) -> None:
         """Initialize the spreadsheet with headers if needed."""
-        self._ensure_sheets_exist()
-
-        # Initialize Positions sheet
-        positions_data = self._get_sheet_data(f"{self.SHEET_POSITIONS}!A1:G1")
+        header_ranges = {
+            self.SHEET_POSITIONS: f"{self.SHEET_POSITIONS}!A1:G1",
+            self.SHEET_TRANSACTIONS: f"{self.SHEET_TRANSACTIONS}!A1:H1",
+            self.SHEET_SUMMARY: f"{self.SHEET_SUMMARY}!A1:B10",
+        }
+        values = self._ensure_sheets_exist(list(header_ranges.values()))
+
+        # Read any headers the combined probe could not return
+        unknown = [title for title in header_ranges if values.get(title) is None]
+        if unknown:
+            rows = self._batch_get_sheet_data([header_ranges[t] for t in unknown])
+            values.update(zip(unknown, rows))
+
+        positions_data = values[self.SHEET_POSITIONS]
+        transactions_data = values[self.SHEET_TRANSACTIONS]
+        summary_data = values[self.SHEET_SUMMARY]
+
+        # Write any missing headers in one request
+        updates = []
         if not positions_data:
-            headers = [
-                ["Ticker", "Shares", "Avg Cost", "Current Price", "Market Value", "Unrealized P&L", "% of Portfolio"]
-            ]
-            self._update_sheet_data(f"{self.SHEET_POSITIONS}!A1:G1", headers)
-            logger.info(f"Initialized {self.SHEET_POSITIONS} sheet")
-
-        # Initialize Transactions sheet
-        transactions_data = self._get_sheet_data(f"{self.SHEET_TRANSACTIONS}!A1:H1")
+            updates.append((f"{self.SHEET_POSITIONS}!A1:G1", [_POSITION_HEADERS]))
         if not transactions_data:
-            headers = [
-                ["Date", "Ticker", "Type", "Shares", "Price", "Fees", "Total", "Notes"]
-            ]
-            self._update_sheet_data(f"{self.SHEET_TRANSACTIONS}!A1:H1", headers)
-            logger.info(f"Initialized {self.SHEET_TRANSACTIONS} sheet")
+            updates.append((f"{self.SHEET_TRANSACTIONS}!A1:H1", [_TRANSACTION_HEADERS]))
+        if updates:
+            self._batch_update_sheet_data(updates)
+            for range_name, _ in updates:
+                logger.info(f"Initialized {range_name.split('!')[0]} sheet")
 
         # Initialize Summary sheet
-        summary_data = self._get_sheet_data(f"{self.SHEET_SUMMARY}!A1:B10")
         if not summary_data or len(summary_data) < 5:
             # Will be updated when portfolio is loaded/saved
             logger.info(f"Initialized {self.SHEET_SUMMARY} sheet")
 
+        self._migrate_to_sorted_views(values)
+
+    def _migrate_to_sorted_views(self, sheets: Dict[str, Any]) -> None:
+        """Turn the visible Positions and Transactions sheets into QUERY views.
+
+        Applies to every visible sheet whose raw sheet exists and whose A2
+        cell is not yet the view formula, so an interrupted migration is
+        retried on the next call. Until then the visible rows are the source
+        of truth: they are copied to the raw sheet and read back before the
+        visible data area is overwritten with the formula. If any step
+        fails, the visible rows are left in place.
+
+        Args:
+            sheets: Titles of the sheets that exist, as returned by
+                _ensure_sheets_exist
+
+        Raises:
+            RuntimeError: If a raw sheet does not read back every copied row
+        """
+        views = [
+            (self.SHEET_POSITIONS_RAW, self.SHEET_POSITIONS, _POSITION_HEADERS, self.POSITIONS_QUERY),
+            (self.SHEET_TRANSACTIONS_RAW, self.SHEET_TRANSACTIONS, _TRANSACTION_HEADERS, self.TRANSACTIONS_QUERY),
+        ]
+        views = [view for view in views if view[0] in sheets and view[1] in sheets]
+        if not views:
+            return
+
+        formulas = self._batch_get_sheet_data(
+            [f"{visible}!A2" for _, visible, _, _ in views],
+            value_render_option="FORMULA",
+        )
+        # Sheets may respace a stored formula, so match on the QUERY source
+        views = [
+            view
+            for view, cell in zip(views, formulas)
+            if not (cell and cell[0] and _is_query_of(cell[0][0], view[0]))
+        ]
+        if not views:
+            return
+
+        last_cols = [chr(ord("A") + len(headers) - 1) for _, _, headers, _ in views]
+        existing = self._batch_get_sheet_data(
+            [f"{visible}!A2:{col}" for (_, visible, _, _), col in zip(views, last_cols)]
+        )
+
+        # Copy the rows and confirm the copy before touching the visible sheet
+        self._batch_update_sheet_data(
+            [
+                (f"{raw}!A1:{col}{len(rows) + 1}", [headers] + rows)
+                for (raw, _, headers, _), col, rows in zip(views, last_cols, existing)
+            ]
+        )
+        copied = self._batch_get_sheet_data(
+            [f"{raw}!A2:{col}" for (raw, _, _, _), col in zip(views, last_cols)]
+        )
+        for (raw, visible, _, _), rows, copy in zip(views, existing, copied):
+            if len(copy) != len(rows):
+                raise RuntimeError(
+                    f"Copied {len(copy)} of {len(rows)} rows from {visible} to {raw}; "
+                    f"leaving {visible} unchanged"
+                )
+            if rows:
+                logger.info(f"Moved {len(rows)} rows from {visible} to {raw}")
+
+        # Replace the visible data area with the formula in one write: the
+        # formula goes in A2 and every other previously used cell is blanked
+        updates = []
+        for (_, visible, headers, query), col, rows in zip(views, last_cols, existing):
+            blank = [""] * len(headers)
+            grid = [[query] + blank[1:]] + [blank] * (len(rows) - 1)
+            updates.append((f"{visible}!A2:{col}{len(grid) + 1}", grid))
+        self._batch_update_sheet_data(updates)
+
     def get_portfolio(self) -> PortfolioSummary:
         """Load the complete portfolio from Google Sheets.
 
         Returns:
             PortfolioSummary object with current state
         """
+        # One timestamp for the whole load, used if the sheet has none
+        now = datetime.now().isoformat()
         try:
-            # Load positions
-            positions = self._load_positions()
-
-            # Load transactions
-            transactions = self._load_transactions()
-
-            # Load summary
-            summary_data = self._load_summary()
+            # Load positions, transactions and summary in one round-trip
+            position_rows, transaction_rows, summary_rows = self._batch_get_sheet_data(
+                [
+                    f"{self.SHEET_POSITIONS}!A2:G1000",
+                    f"{self.SHEET_TRANSACTIONS}!A2:H1000",
+                    f"{self.SHEET_SUMMARY}!A1:B20",
+                ]
+            )
+            positions = self._load_positions(position_rows)
+            transactions = self._load_transactions(transaction_rows)
+            summary_data = self._load_summary(summary_rows)
 
             return PortfolioSummary(
                 total_value=summary_data.get("total_value", 0.0),
@@ -231,7 +440,7 @@ class GoogleSheetsPortfolio:
                 transactions=transactions,
                 daily_pnl=summary_data.get("daily_pnl", 0.0),
                 overall_pnl=summary_data.get("overall_pnl", 0.0),
-                last_updated=summary_data.get("last_updated", ""),
+                last_updated=summary_data.get("last_updated") or now,
             )
 
         except Exception as e:
@@ -242,61 +451,117 @@ class GoogleSheetsPortfolio:
                 cash_balance=0.0,
                 positions=[],
                 transactions=[],
+                last_updated=now,
             )
 
-    def _load_positions(self) -> List[Position]:
-        """Load positions from the Positions sheet."""
-        rows = self._get_sheet_data(f"{self.SHEET_POSITIONS}!A2:G1000")
+    def _load_positions(self, rows: List[List[str]]) -> PositionArray:
+        """Parse positions from rows of the Positions sheet."""
+        rows = [row[:7] for row in rows if len(row) >= 7]
+        if not rows:
+            return PositionArray()
+
+        # Convert all numeric columns in one vectorized cast
+        try:
+            table = np.array(rows, dtype=str)
+            values = table[:, 1:7].astype(np.float64)
+        except ValueError:
+            # At least one malformed cell; parse row by row to skip it
+            return PositionArray.from_positions(self._load_positions_rowwise(rows))
+
+        # Drop closed or invalid rows, as Position validation would
+        valid = (values[:, :3] > 0).all(axis=1)
+        if not valid.all():
+            for row in table[~valid].tolist():
+                logger.warning(
+                    f"Skipping invalid position row {row}: "
+                    "shares, average cost and current price must be positive"
+                )
+            table = table[valid]
+            values = values[valid]
+
+        return PositionArray(
+            np.char.upper(np.char.strip(table[:, 0])).astype(object),
+            *values.T,
+        )
+
+    def _load_positions_rowwise(self, rows: List[List[str]]) -> List[Position]:
+        """Parse positions one row at a time, skipping invalid rows."""
         positions = []
 
         for row in rows:
             if len(row) < 7:
                 continue
             try:
-                position = Position(
-                    ticker=row[0],
-                    shares=float(row[1]),
-                    avg_cost=float(row[2]),
-                    current_price=float(row[3]),
-                    market_value=float(row[4]),
-                    unrealized_pnl=float(row[5]),
-                    portfolio_percentage=float(row[6]),
-                )
-                positions.append(position)
+                positions.append(Position._from_row(row))
             except (ValueError, IndexError) as e:
                 logger.warning(f"Skipping invalid position row {row}: {e}")
 
         return positions
 
-    def _load_transactions(self) -> List[Transaction]:
-        """Load transactions from the Transactions sheet."""
-        rows = self._get_sheet_data(f"{self.SHEET_TRANSACTIONS}!A2:H1000")
+    def _load_transactions(self, rows: List[List[str]]) -> TransactionLog:
+        """Parse transactions from rows of the Transactions sheet."""
+        rows = [row[:7] for row in rows if len(row) >= 7]
+        if not rows:
+            return TransactionLog()
+
+        # Convert all numeric columns in one vectorized cast; empty fees
+        # count as zero and empty totals are derived below
+        try:
+            table = np.array(rows, dtype=str)
+            fees = np.where(table[:, 5] == "", "0", table[:, 5]).astype(np.float64)
+            has_total = table[:, 6] != ""
+            total = np.where(has_total, table[:, 6], "nan").astype(np.float64)
+            shares, price = table[:, 3:5].astype(np.float64).T
+        except ValueError:
+            # At least one malformed cell; parse row by row to skip it
+            return TransactionLog.from_transactions(self._load_transactions_rowwise(rows))
+
+        kind = np.char.lower(np.char.strip(table[:, 2]))
+        is_buy = kind == "buy"
+
+        # Drop invalid rows, as Transaction validation would
+        valid = (is_buy | (kind == "sell")) & (shares > 0) & (price > 0) & (fees >= 0)
+        if not valid.all():
+            for row in table[~valid].tolist():
+                logger.warning(
+                    f"Skipping invalid transaction row {row}: type must be 'buy' or "
+                    "'sell', shares and price positive and fees non-negative"
+                )
+            table = table[valid]
+            is_buy, shares, price, fees = is_buy[valid], shares[valid], price[valid], fees[valid]
+            has_total, total = has_total[valid], total[valid]
+
+        cost = shares * price
+        total = np.where(
+            has_total, total, np.where(is_buy, -(cost + fees), cost - fees)
+        )
+        # Already newest-first: the sheet sorts them with TRANSACTIONS_QUERY
+        return TransactionLog(
+            table[:, 0].astype(object),
+            np.char.upper(np.char.strip(table[:, 1])).astype(object),
+            is_buy,
+            shares,
+            price,
+            fees,
+            total,
+        )
+
+    def _load_transactions_rowwise(self, rows: List[List[str]]) -> List[Transaction]:
+        """Parse transactions one row at a time, skipping invalid rows."""
         transactions = []
 
         for row in rows:
             if len(row) < 7:
                 continue
             try:
-                transaction = Transaction(
-                    date=row[0],
-                    ticker=row[1],
-                    type=row[2],
-                    shares=float(row[3]),
-                    price=float(row[4]),
-                    fees=float(row[5]) if len(row) > 5 and row[5] else 0.0,
-                    total=float(row[6]) if len(row) > 6 and row[6] else None,
-                )
-                transactions.append(transaction)
+                transactions.append(Transaction._from_row(row))
             except (ValueError, IndexError) as e:
                 logger.warning(f"Skipping invalid transaction row {row}: {e}")
 
-        # Sort by date descending (newest first)
-        transactions.sort(key=lambda t: t.date, reverse=True)
         return transactions
 
-    def _load_summary(self) -> Dict[str, Any]:
-        """Load summary data from the Summary sheet."""
-        rows = self._get_sheet_data(f"{self.SHEET_SUMMARY}!A1:B20")
+    def _load_summary(self, rows: List[List[str]]) -> Dict[str, Any]:
+        """Parse summary data from rows of the Summary sheet."""
         summary = {}
 
         for row in rows:
@@ -305,14 +570,15 @@ class GoogleSheetsPortfolio:
             key = row[0].strip().lower().replace(" ", "_")
             value = row[1]
 
-            # Parse numeric values
-            try:
-                if key in ["total_value", "cash_balance", "daily_pnl", "overall_pnl"]:
-                    summary[key] = float(value)
-                else:
-                    summary[key] = value
-            except (ValueError, TypeError):
+            if key not in _NUMERIC_SUMMARY_KEYS:
                 summary[key] = value
+                continue
+
+            # Parse numeric values; a malformed cell falls back to the default
+            try:
+                summary[key] = float(value)
+            except ValueError:
+                logger.warning(f"Ignoring non-numeric summary value {row[0]!r}: {value!r}")
 
         return summary
 
@@ -323,14 +589,14 @@ class GoogleSheetsPortfolio:
             portfolio: PortfolioSummary object to save
         """
         try:
-            # Save positions
-            self._save_positions(portfolio.positions)
-
-            # Save transactions
-            self._save_transactions(portfolio.transactions)
-
-            # Save summary
-            self._save_summary(portfolio)
+            # Write positions, transactions and summary in one round-trip
+            self._batch_update_sheet_data(
+                [
+                    self._save_positions(portfolio.positions),
+                    self._save_transactions(portfolio.transactions),
+                    self._save_summary(portfolio, datetime.now().isoformat()),
+                ]
+            )
 
             logger.info(f"Portfolio saved to Google Sheets")
 
@@ -338,51 +604,82 @@ class GoogleSheetsPortfolio:
             logger.error(f"Error saving portfolio: {e}")
             raise
 
-    def _save_positions(self, positions: List[Position]) -> None:
-        """Save positions to the Positions sheet."""
-        # Prepare data rows
-        rows = [["Ticker", "Shares", "Avg Cost", "Current Price", "Market Value", "Unrealized P&L", "% of Portfolio"]]
-
-        for pos in sorted(positions, key=lambda p: p.market_value, reverse=True):
-            rows.append([
-                pos.ticker,
-                str(pos.shares),
-                str(pos.avg_cost),
-                str(pos.current_price),
-                str(pos.market_value),
-                str(pos.unrealized_pnl),
-                str(pos.portfolio_percentage),
-            ])
-
-        # Clear and update
-        range_name = f"{self.SHEET_POSITIONS}!A1:G{len(rows)}"
-        self._update_sheet_data(range_name, rows)
-
-    def _save_transactions(self, transactions: List[Transaction]) -> None:
-        """Save transactions to the Transactions sheet."""
-        # Keep header
-        rows = [["Date", "Ticker", "Type", "Shares", "Price", "Fees", "Total", "Notes"]]
-
-        # Sort by date descending (newest first)
-        for txn in sorted(transactions, key=lambda t: t.date, reverse=True):
-            rows.append([
-                txn.date,
-                txn.ticker,
-                txn.type,
-                str(txn.shares),
-                str(txn.price),
-                str(txn.fees),
-                str(txn.total if txn.total is not None else ""),
-                "",  # Notes column
-            ])
-
-        # Clear and update
-        range_name = f"{self.SHEET_TRANSACTIONS}!A1:H{len(rows)}"
-        self._update_sheet_data(range_name, rows)
-
-    def _save_summary(self, portfolio: PortfolioSummary) -> None:
-        """Save summary to the Summary sheet."""
-        now = datetime.now().isoformat()
+    def _save_positions(
+        self, positions: PositionArray
+    ) -> Tuple[str, List[List[str]]]:
+        """Build the (range, rows) update for the raw Positions sheet.
+
+        Rows are written unsorted; the visible Positions sheet orders them.
+        """
+        rows = [_POSITION_HEADERS]
+
+        if len(positions):
+            # Format each numeric column in one vectorized pass
+            columns = [
+                positions.ticker.tolist(),
+                _format_numbers(positions.shares),
+                _format_numbers(positions.avg_cost),
+                _format_numbers(positions.current_price),
+                _format_numbers(positions.market_value),
+                _format_numbers(positions.unrealized_pnl),
+                _format_numbers(positions.portfolio_percentage),
+            ]
+            rows.extend(map(list, zip(*columns)))
+
+        range_name = f"{self.SHEET_POSITIONS_RAW}!A1:G{len(rows)}"
+        return range_name, rows
+
+    def _save_transactions(
+        self, transactions: TransactionLog
+    ) -> Tuple[str, List[List[str]]]:
+        """Build the (range, rows) update for the raw Transactions sheet.
+
+        Rows are written unsorted; the visible Transactions sheet orders them.
+        """
+        rows = [_TRANSACTION_HEADERS]
+
+        if len(transactions):
+            # Format each numeric column in one vectorized pass
+            columns = [
+                transactions.date.tolist(),
+                transactions.ticker.tolist(),
+                np.where(transactions.is_buy, "buy", "sell").tolist(),
+                _format_numbers(transactions.shares),
+                _format_numbers(transactions.price),
+                _format_numbers(transactions.fees),
+                _format_numbers(transactions.total),
+                [""] * len(transactions),  # Notes column
+            ]
+            rows.extend(map(list, zip(*columns)))
+
+        range_name = f"{self.SHEET_TRANSACTIONS_RAW}!A1:H{len(rows)}"
+        return range_name, rows
+
+    @staticmethod
+    def _transaction_row(txn: Transaction) -> List[str]:
+        """Format a transaction as a Transactions sheet row."""
+        return [
+            txn.date,
+            txn.ticker,
+            txn.type,
+            str(float(txn.shares)),
+            str(float(txn.price)),
+            str(float(txn.fees)),
+            str(float(txn.total)) if txn.total is not None else "",
+            "",  # Notes column
+        ]
+
+    def _save_summary(
+        self, portfolio: PortfolioSummary, now: Optional[str] = None
+    ) -> Tuple[str, List[List[str]]]:
+        """Build the (range, rows) update for the Summary sheet.
+
+        Args:
+            portfolio: Portfolio to summarize
+            now: Timestamp for the Last Updated row, computed if omitted
+        """
+        if now is None:
+            now = datetime.now().isoformat()
 
         rows = [
             ["Total Value", str(portfolio.total_value)],
@@ -396,7 +693,7 @@ class GoogleSheetsPortfolio:
         ]
 
         range_name = f"{self.SHEET_SUMMARY}!A1:B{len(rows)}"
-        self._update_sheet_data(range_name, rows)
+        return range_name, rows
 
     def add_transaction(self, transaction: Transaction) -> None:
         """Add a new transaction to the portfolio.
@@ -404,9 +701,23 @@ class GoogleSheetsPortfolio:
         Args:
             transaction: Transaction to add
         """
-        portfolio = self.get_portfolio()
-        portfolio.transactions.append(transaction)
-        self.save_portfolio(portfolio)
+        # Append the row directly; no need to read back the whole portfolio
+        try:
+            (
+                self.service.spreadsheets()
+                .values()
+                .append(
+                    spreadsheetId=self.sheet_id,
+                    range=f"{self.SHEET_TRANSACTIONS_RAW}!A:H",
+                    valueInputOption="USER_ENTERED",
+                    insertDataOption="INSERT_ROWS",
+                    body={"values": [self._transaction_row(transaction)]},
+                )
+                .execute()
+            )
+        except Exception as e:
+            logger.error(f"Error appending transaction: {e}")
+            raise
         logger.info(f"Added transaction: {transaction.type} {transaction.shares} {transaction.ticker}")
 
     def update_position(
@@ -424,7 +735,7 @@ class GoogleSheetsPortfolio:
             avg_cost: Average cost (optional)
             current_price: Current market price (optional)
         """
-        portfolio = self.get_portfolio()
+        portfolio = self._get_positions_and_summary()
 
         # Find existing position or create new one
         position = portfolio.get_position(ticker)
@@ -439,6 +750,7 @@ class GoogleSheetsPortfolio:
                 position.current_price = current_price
                 position.market_value = position.shares * current_price
                 position.unrealized_pnl = (current_price - position.avg_cost) * position.shares
+            portfolio.set_position(position)
         else:
             # Create new position
             if shares is None or avg_cost is None or current_price is None:
@@ -457,7 +769,43 @@ class GoogleSheetsPortfolio:
                 unrealized_pnl=unrealized_pnl,
                 portfolio_percentage=portfolio_percentage,
             )
-            portfolio.positions.append(position)
+            portfolio.set_position(position)
 
-        self.save_portfolio(portfolio)
+        self._save_positions_and_summary(portfolio)
         logger.info(f"Updated position: {ticker}")
+
+    def reprice_positions(self, prices: Dict[str, float]) -> None:
+        """Update current prices for many positions in one read and one write.
+
+        Args:
+            prices: Mapping of ticker to current market price
+        """
+        portfolio = self._get_positions_and_summary()
+        portfolio.reprice(prices)
+        self._save_positions_and_summary(portfolio)
+        logger.info(f"Repriced {len(prices)} positions")
+
+    def _get_positions_and_summary(self) -> PortfolioSummary:
+        """Load positions and summary (without transactions) in one request."""
+        now = datetime.now().isoformat()
+        position_rows, summary_rows = self._batch_get_sheet_data(
+            [f"{self.SHEET_POSITIONS}!A2:G1000", f"{self.SHEET_SUMMARY}!A1:B20"]
+        )
+        summary_data = self._load_summary(summary_rows)
+        return PortfolioSummary(
+            total_value=summary_data.get("total_value", 0.0),
+            cash_balance=summary_data.get("cash_balance", 0.0),
+            positions=self._load_positions(position_rows),
+            daily_pnl=summary_data.get("daily_pnl", 0.0),
+            overall_pnl=summary_data.get("overall_pnl", 0.0),
+            last_updated=summary_data.get("last_updated") or now,
+        )
+
+    def _save_positions_and_summary(self, portfolio: PortfolioSummary) -> None:
+        """Write positions and summary in one request."""
+        self._batch_update_sheet_data(
+            [
+                self._save_positions(portfolio.positions),
+                self._save_summary(portfolio, datetime.now().isoformat()),
+            ]
+        )
@@ -1,12 +1,27 @@
 """Portfolio data models for tracking positions and transactions."""
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from decimal import Decimal
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional; falls back to the standard json module
+    orjson = None
+
+
+def _pnl_percentage(current_price: float, avg_cost: float) -> float:
+    """Unrealized P&L as a percentage of cost (0.0 when cost is zero)."""
+    if avg_cost == 0:
+        return 0.0
+    return ((current_price - avg_cost) / avg_cost) * 100
+
+
+@dataclass(slots=True)
 class Position:
     """Represents a current holding in the portfolio."""
 
@@ -21,6 +36,10 @@ class Position:
     def __post_init__(self):
         """Validate and normalize the position data."""
         self.ticker = self.ticker.upper().strip()
+        self._check_positive()
+
+    def _check_positive(self) -> None:
+        """Raise ValueError unless shares, average cost and price are positive."""
         if self.shares <= 0:
             raise ValueError(f"Shares must be positive for {self.ticker}")
         if self.avg_cost <= 0:
@@ -31,12 +50,10 @@ class Position:
     @property
     def unrealized_pnl_percentage(self) -> float:
         """Calculate unrealized P&L as a percentage."""
-        if self.avg_cost == 0:
-            return 0.0
-        return ((self.current_price - self.avg_cost) / self.avg_cost) * 100
+        return _pnl_percentage(self.current_price, self.avg_cost)
 
     @property
-    is_profitable(self) -> bool:
+    def is_profitable(self) -> bool:
         """Check if position is profitable."""
         return self.unrealized_pnl > 0
 
@@ -53,6 +70,51 @@ class Position:
             "portfolio_percentage": self.portfolio_percentage,
         }
 
+    @classmethod
+    def _from_row(cls, row: List[str]) -> "Position":
+        """Create Position from a Positions sheet row.
+
+        Applies the same checks as __post_init__ without going through the
+        dataclass constructor, so closed (zero-share) rows are rejected.
+
+        Raises:
+            ValueError: If a cell is not numeric or a check fails
+        """
+        _f = float
+        position = cls._from_values(
+            row[0],
+            _f(row[1]),
+            _f(row[2]),
+            _f(row[3]),
+            _f(row[4]),
+            _f(row[5]),
+            _f(row[6]),
+        )
+        position._check_positive()
+        return position
+
+    @classmethod
+    def _from_values(
+        cls,
+        ticker: str,
+        shares: float,
+        avg_cost: float,
+        current_price: float,
+        market_value: float,
+        unrealized_pnl: float,
+        portfolio_percentage: float,
+    ) -> "Position":
+        """Create Position from already-parsed values without validation."""
+        obj = cls.__new__(cls)
+        obj.ticker = ticker.upper().strip()
+        obj.shares = shares
+        obj.avg_cost = avg_cost
+        obj.current_price = current_price
+        obj.market_value = market_value
+        obj.unrealized_pnl = unrealized_pnl
+        obj.portfolio_percentage = portfolio_percentage
+        return obj
+
     @classmethod
     def from_dict(cls, data: dict) -> "Position":
         """Create Position from dictionary."""
@@ -67,7 +129,7 @@ class Position:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Represents a buy or sell transaction in the portfolio."""
 
@@ -83,6 +145,17 @@ class Transaction:
         """Validate and normalize the transaction data."""
         self.ticker = self.ticker.upper().strip()
         self.type = self.type.lower().strip()
+        self._check_valid()
+
+        # Calculate total if not provided
+        if self.total is None:
+            if self.type == "buy":
+                self.total = -(self.shares * self.price + self.fees)
+            else:
+                self.total = self.shares * self.price - self.fees
+
+    def _check_valid(self) -> None:
+        """Raise ValueError unless type, shares, price and fees are valid."""
         if self.type not in ("buy", "sell"):
             raise ValueError(f"Transaction type must be 'buy' or 'sell', got '{self.type}'")
         if self.shares <= 0:
@@ -92,13 +165,6 @@ class Transaction:
         if self.fees < 0:
             raise ValueError(f"Fees cannot be negative for {self.ticker} {self.type}")
 
-        # Calculate total if not provided
-        if self.total is None:
-            if self.type == "buy":
-                self.total = -(self.shares * self.price + self.fees)
-            else:
-                self.total = self.shares * self.price - self.fees
-
     @property
     def is_buy(self) -> bool:
         """Check if this is a buy transaction."""
@@ -121,6 +187,53 @@ class Transaction:
             "total": self.total,
         }
 
+    @classmethod
+    def _from_row(cls, row: List[str]) -> "Transaction":
+        """Create Transaction from a Transactions sheet row.
+
+        Applies the same normalization and checks as __post_init__ without
+        going through the dataclass constructor.
+        """
+        _f = float
+        obj = cls._from_values(
+            row[0],
+            row[1].upper().strip(),
+            row[2].lower().strip(),
+            _f(row[3]),
+            _f(row[4]),
+            _f(row[5]) if row[5] else 0.0,
+            _f(row[6]) if row[6] else None,
+        )
+        obj._check_valid()
+        if obj.total is None:
+            if obj.type == "buy":
+                obj.total = -(obj.shares * obj.price + obj.fees)
+            else:
+                obj.total = obj.shares * obj.price - obj.fees
+        return obj
+
+    @classmethod
+    def _from_values(
+        cls,
+        date: str,
+        ticker: str,
+        type: str,
+        shares: float,
+        price: float,
+        fees: float,
+        total: Optional[float],
+    ) -> "Transaction":
+        """Create Transaction from already-normalized values without validation."""
+        obj = cls.__new__(cls)
+        obj.date = date
+        obj.ticker = ticker
+        obj.type = type
+        obj.shares = shares
+        obj.price = price
+        obj.fees = fees
+        obj.total = total
+        return obj
+
     @classmethod
     def from_dict(cls, data: dict) -> "Transaction":
         """Create Transaction from dictionary."""
@@ -135,18 +248,310 @@ class Transaction:
         )
 
 
-@dataclass
+class PositionArray:
+    """Columnar (struct-of-arrays) storage for portfolio positions.
+
+    Each position field is held in its own NumPy array so aggregates and
+    sorting run as single vectorized operations. Indexing and iteration
+    yield Position objects built on demand, so the container can be used
+    like a list of positions; mutate it through item assignment or
+    ``append`` rather than by changing the yielded objects.
+    """
+
+    __slots__ = (
+        "ticker",
+        "shares",
+        "avg_cost",
+        "current_price",
+        "market_value",
+        "unrealized_pnl",
+        "portfolio_percentage",
+        "unrealized_pnl_percentage",
+        "_index",
+    )
+
+    NUMERIC_FIELDS = (
+        "shares",
+        "avg_cost",
+        "current_price",
+        "market_value",
+        "unrealized_pnl",
+        "portfolio_percentage",
+    )
+
+    def __init__(
+        self,
+        ticker: Optional[np.ndarray] = None,
+        shares: Optional[np.ndarray] = None,
+        avg_cost: Optional[np.ndarray] = None,
+        current_price: Optional[np.ndarray] = None,
+        market_value: Optional[np.ndarray] = None,
+        unrealized_pnl: Optional[np.ndarray] = None,
+        portfolio_percentage: Optional[np.ndarray] = None,
+    ):
+        """Initialize from column arrays (all must have the same length)."""
+        # ticker -> row lookup, built on first use and reset on mutation
+        self._index: Optional[Dict[str, int]] = None
+        self.ticker = (
+            np.empty(0, dtype=object) if ticker is None else np.asarray(ticker, dtype=object)
+        )
+        columns = (
+            shares,
+            avg_cost,
+            current_price,
+            market_value,
+            unrealized_pnl,
+            portfolio_percentage,
+        )
+        for name, column in zip(self.NUMERIC_FIELDS, columns):
+            setattr(
+                self,
+                name,
+                np.zeros(len(self.ticker)) if column is None
+                else np.asarray(column, dtype=np.float64),
+            )
+        self._update_pnl_percentage()
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Position]) -> "PositionArray":
+        """Create PositionArray from Position objects."""
+        positions = list(positions)
+        return cls(
+            ticker=[p.ticker for p in positions],
+            **{
+                name: [getattr(p, name) for p in positions]
+                for name in cls.NUMERIC_FIELDS
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.ticker)
+
+    def __getitem__(self, index: int) -> Position:
+        """Return the position at ``index`` as a new Position object."""
+        return Position._from_values(
+            self.ticker[index],
+            float(self.shares[index]),
+            float(self.avg_cost[index]),
+            float(self.current_price[index]),
+            float(self.market_value[index]),
+            float(self.unrealized_pnl[index]),
+            float(self.portfolio_percentage[index]),
+        )
+
+    def __setitem__(self, index: int, position: Position) -> None:
+        """Overwrite the position at ``index``."""
+        if self.ticker[index] != position.ticker:
+            self._index = None
+        self.ticker[index] = position.ticker
+        for name in self.NUMERIC_FIELDS:
+            getattr(self, name)[index] = getattr(position, name)
+        self.unrealized_pnl_percentage[index] = _pnl_percentage(
+            position.current_price, position.avg_cost
+        )
+
+    def __iter__(self) -> Iterator[Position]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"PositionArray({list(self)!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PositionArray):
+            return NotImplemented
+        return np.array_equal(self.ticker, other.ticker) and all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            for name in self.NUMERIC_FIELDS
+        )
+
+    def append(self, position: Position) -> None:
+        """Add a position to the end of the array."""
+        self._index = None
+        self.ticker = np.append(self.ticker, np.array([position.ticker], dtype=object))
+        for name in self.NUMERIC_FIELDS:
+            setattr(self, name, np.append(getattr(self, name), getattr(position, name)))
+        self.unrealized_pnl_percentage = np.append(
+            self.unrealized_pnl_percentage,
+            _pnl_percentage(position.current_price, position.avg_cost),
+        )
+
+    def index_of(self, ticker: str) -> Optional[int]:
+        """Return the row of an (already normalized) ticker, or None."""
+        if self._index is None:
+            # Iterate in reverse so the first row wins for duplicate tickers
+            tickers = self.ticker.tolist()
+            self._index = {
+                tickers[i]: i for i in range(len(tickers) - 1, -1, -1)
+            }
+        return self._index.get(ticker)
+
+    def take(self, indices: np.ndarray) -> "PositionArray":
+        """Return a new PositionArray with the rows at ``indices``."""
+        return PositionArray(
+            ticker=self.ticker[indices],
+            **{name: getattr(self, name)[indices] for name in self.NUMERIC_FIELDS},
+        )
+
+    def sorted_by_value(self) -> "PositionArray":
+        """Return the positions ordered by market value, largest first."""
+        return self.take(np.argsort(-self.market_value, kind="stable"))
+
+    def reprice(self, prices: np.ndarray, total_value: float) -> None:
+        """Set new current prices and recompute the derived columns.
+
+        Args:
+            prices: New current price for every position, in array order
+            total_value: Total portfolio value used for allocation percentages
+        """
+        self.current_price = np.asarray(prices, dtype=np.float64)
+        self.market_value = self.shares * self.current_price
+        self.unrealized_pnl = (self.current_price - self.avg_cost) * self.shares
+        if total_value > 0:
+            self.portfolio_percentage = self.market_value / total_value * 100
+        self._update_pnl_percentage()
+
+    @property
+    def invested_value(self) -> float:
+        """Total market value of all positions."""
+        return float(self.market_value.sum())
+
+    def _update_pnl_percentage(self) -> None:
+        """Recompute the derived unrealized P&L percentage column."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = (self.current_price - self.avg_cost) / self.avg_cost * 100
+        self.unrealized_pnl_percentage = np.where(self.avg_cost == 0, 0.0, pct)
+
+
+class TransactionLog:
+    """Columnar (struct-of-arrays) storage for the transaction history.
+
+    Like PositionArray, each field is a NumPy array and indexing or
+    iteration yields Transaction objects built on demand. The type is
+    stored as a boolean ``is_buy`` column.
+    """
+
+    __slots__ = ("date", "ticker", "is_buy", "shares", "price", "fees", "total")
+
+    NUMERIC_FIELDS = ("shares", "price", "fees", "total")
+
+    def __init__(
+        self,
+        date: Optional[np.ndarray] = None,
+        ticker: Optional[np.ndarray] = None,
+        is_buy: Optional[np.ndarray] = None,
+        shares: Optional[np.ndarray] = None,
+        price: Optional[np.ndarray] = None,
+        fees: Optional[np.ndarray] = None,
+        total: Optional[np.ndarray] = None,
+    ):
+        """Initialize from column arrays (all must have the same length)."""
+        self.date = np.empty(0, dtype=object) if date is None else np.asarray(date, dtype=object)
+        self.ticker = (
+            np.empty(0, dtype=object) if ticker is None else np.asarray(ticker, dtype=object)
+        )
+        self.is_buy = (
+            np.zeros(len(self.date), dtype=bool) if is_buy is None
+            else np.asarray(is_buy, dtype=bool)
+        )
+        for name, column in zip(self.NUMERIC_FIELDS, (shares, price, fees, total)):
+            setattr(
+                self,
+                name,
+                np.zeros(len(self.date)) if column is None
+                else np.asarray(column, dtype=np.float64),
+            )
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> "TransactionLog":
+        """Create TransactionLog from Transaction objects."""
+        transactions = list(transactions)
+        return cls(
+            date=[t.date for t in transactions],
+            ticker=[t.ticker for t in transactions],
+            is_buy=[t.type == "buy" for t in transactions],
+            **{
+                name: [getattr(t, name) for t in transactions]
+                for name in cls.NUMERIC_FIELDS
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __getitem__(self, index: int) -> Transaction:
+        """Return the transaction at ``index`` as a new Transaction object."""
+        return Transaction._from_values(
+            self.date[index],
+            self.ticker[index],
+            "buy" if self.is_buy[index] else "sell",
+            float(self.shares[index]),
+            float(self.price[index]),
+            float(self.fees[index]),
+            float(self.total[index]),
+        )
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"TransactionLog({list(self)!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TransactionLog):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            for name in self.__slots__
+        )
+
+    def append(self, transaction: Transaction) -> None:
+        """Add a transaction to the end of the log."""
+        self.extend([transaction])
+
+    def extend(self, transactions: Iterable[Transaction]) -> None:
+        """Add several transactions with one reallocation per column."""
+        other = TransactionLog.from_transactions(transactions)
+        for name in self.__slots__:
+            setattr(self, name, np.concatenate((getattr(self, name), getattr(other, name))))
+
+    @property
+    def net_cash_flow(self) -> float:
+        """Sum of all transaction totals (buys negative, sells positive)."""
+        return float(self.total.sum())
+
+    @property
+    def total_fees(self) -> float:
+        """Sum of fees paid across all transactions."""
+        return float(self.fees.sum())
+
+
+@dataclass(slots=True)
 class PortfolioSummary:
-    """Summary of the entire portfolio state."""
+    """Summary of the entire portfolio state.
+
+    Positions and transactions are stored columnar; lists assigned to either
+    field, at construction or later, are converted. Indexing them returns
+    copies, so change positions through set_position or reprice.
+    """
 
     total_value: float
     cash_balance: float
-    positions: List[Position] = field(default_factory=list)
-    transactions: List[Transaction] = field(default_factory=list)
+    positions: PositionArray = field(default_factory=PositionArray)
+    transactions: TransactionLog = field(default_factory=TransactionLog)
     daily_pnl: float = 0.0
     overall_pnl: float = 0.0
     last_updated: str = ""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store positions and transactions columnar, converting lists."""
+        if name == "positions" and not isinstance(value, PositionArray):
+            value = PositionArray.from_positions(value)
+        elif name == "transactions" and not isinstance(value, TransactionLog):
+            value = TransactionLog.from_transactions(value)
+        object.__setattr__(self, name, value)
+
     def __post_init__(self):
         """Validate and set default last_updated."""
         if not self.last_updated:
@@ -159,7 +564,7 @@ class PortfolioSummary:
     @property
     def invested_value(self) -> float:
         """Calculate total value of all positions."""
-        return sum(p.market_value for p in self.positions)
+        return self.positions.invested_value
 
     @property
     def position_count(self) -> int:
@@ -179,12 +584,37 @@ class PortfolioSummary:
         return (self.cash_balance / self.total_value) * 100
 
     def get_position(self, ticker: str) -> Optional[Position]:
-        """Get a position by ticker symbol."""
-        ticker = ticker.upper().strip()
-        for pos in self.positions:
-            if pos.ticker == ticker:
-                return pos
-        return None
+        """Get a position by ticker symbol.
+
+        The returned Position is a copy; use set_position to store changes.
+        """
+        index = self.positions.index_of(ticker.upper().strip())
+        if index is None:
+            return None
+        return self.positions[index]
+
+    def set_position(self, position: Position) -> None:
+        """Replace the position with the same ticker, or add it."""
+        index = self.positions.index_of(position.ticker)
+        if index is None:
+            self.positions.append(position)
+        else:
+            self.positions[index] = position
+
+    def reprice(self, new_prices: Dict[str, float]) -> None:
+        """Update current prices and recompute values for many positions at once.
+
+        Args:
+            new_prices: Mapping of ticker to new current price. Tickers not
+                held in the portfolio are ignored.
+        """
+        positions = self.positions
+        prices = positions.current_price.copy()
+        for ticker, price in new_prices.items():
+            i = positions.index_of(ticker.upper().strip())
+            if i is not None:
+                prices[i] = price
+        positions.reprice(prices, self.total_value)
 
     def has_position(self, ticker: str) -> bool:
         """Check if portfolio has a position in the given ticker."""
@@ -214,8 +644,14 @@ class PortfolioSummary:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "PortfolioSummary":
-        """Create PortfolioSummary from dictionary."""
+    def from_dict(cls, data: dict, now: Optional[str] = None) -> "PortfolioSummary":
+        """Create PortfolioSummary from dictionary.
+
+        Args:
+            data: Dictionary as produced by to_dict
+            now: Timestamp to use when data has no last_updated; when
+                rebuilding many summaries, pass one shared value
+        """
         return cls(
             total_value=data["total_value"],
             cash_balance=data["cash_balance"],
@@ -223,9 +659,27 @@ class PortfolioSummary:
             transactions=[Transaction.from_dict(t) for t in data.get("transactions", [])],
             daily_pnl=data.get("daily_pnl", 0.0),
             overall_pnl=data.get("overall_pnl", 0.0),
-            last_updated=data.get("last_updated", ""),
+            last_updated=data.get("last_updated") or now or "",
         )
 
+    def to_json(self) -> bytes:
+        """Serialize the portfolio to UTF-8 JSON bytes.
+
+        Uses orjson when it is installed and the standard json module
+        otherwise; both produce the same structure as to_dict.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(data).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "PortfolioSummary":
+        """Create PortfolioSummary from JSON produced by to_json."""
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(data))
+        return cls.from_dict(json.loads(data))
+
     def format_summary(self) -> str:
         """Format portfolio summary for display in agent prompts."""
         lines = [
@@ -239,15 +693,26 @@ class PortfolioSummary:
             pnl_sign = "+" if self.overall_pnl > 0 else ""
             lines.append(f"Overall P&L: {pnl_sign}${self.overall_pnl:,.2f}")
 
-        if self.positions:
+        if len(self.positions):
             lines.append("\nCurrent Positions:")
-            for pos in sorted(self.positions, key=lambda p: p.market_value, reverse=True):
-                pnl_sign = "+" if pos.unrealized_pnl > 0 else ""
+            positions = self.positions.sorted_by_value()
+            columns = zip(
+                positions.ticker.tolist(),
+                positions.shares.tolist(),
+                positions.avg_cost.tolist(),
+                positions.current_price.tolist(),
+                positions.market_value.tolist(),
+                positions.portfolio_percentage.tolist(),
+                positions.unrealized_pnl.tolist(),
+                positions.unrealized_pnl_percentage.tolist(),
+            )
+            for ticker, shares, avg_cost, price, value, pct, pnl, pnl_pct in columns:
+                pnl_sign = "+" if pnl > 0 else ""
                 lines.append(
-                    f"  - {pos.ticker}: {pos.shares} shares @ ${pos.avg_cost:.2f} | "
-                    f"Current: ${pos.current_price:.2f} | "
-                    f"Value: ${pos.market_value:,.2f} ({pos.portfolio_percentage:.1f}%) | "
-                    f"P&L: {pnl_sign}${pos.unrealized_pnl:,.2f} ({pos.unrealized_pnl_percentage:+.1f}%)"
+                    f"  - {ticker}: {shares} shares @ ${avg_cost:.2f} | "
+                    f"Current: ${price:.2f} | "
+                    f"Value: ${value:,.2f} ({pct:.1f}%) | "
+                    f"P&L: {pnl_sign}${pnl:,.2f} ({pnl_pct:+.1f}%)"
                 )
 
         return "\n".join(lines)
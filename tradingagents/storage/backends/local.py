@@ -1,10 +1,12 @@
 """Local filesystem storage backend."""
 
+import os
 import shutil
 from pathlib import Path
 from typing import List, Optional
 
 from ..base import BaseStorageBackend
+from ..cache import TTLCache
 
 
 class LocalStorageBackend(BaseStorageBackend):
@@ -12,6 +14,9 @@ class LocalStorageBackend(BaseStorageBackend):
 
     backend_name = "local"
 
+    # Seconds an exists() result is reused before the file is checked again
+    EXISTS_CACHE_TTL = 30.0
+
     def __init__(self, base_path: Path):
         """Initialize local storage backend.
 
@@ -20,6 +25,23 @@ class LocalStorageBackend(BaseStorageBackend):
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # String form of base_path for lookups that skip pathlib
+        self._base_str = os.fspath(self.base_path)
+        self._exists_cache = TTLCache(maxsize=1024, ttl=self.EXISTS_CACHE_TTL)
+        # Directories already created (or found) by this backend
+        self._known_dirs = {self._base_str}
+
+    def _ensure_parent(self, destination: Path) -> None:
+        """Create the destination's parent directory unless already known to exist."""
+        parent = destination.parent
+        parent_str = os.fspath(parent)
+        if parent_str not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent_str)
+
+    def _forget_dirs(self) -> None:
+        """Forget known directories after some may have been removed."""
+        self._known_dirs = {self._base_str}
 
     def upload_file(
         self,
@@ -39,13 +61,26 @@ class LocalStorageBackend(BaseStorageBackend):
         """
         destination = self.base_path / remote_key
 
-        # Skip if source and destination are the same file
-        if local_path.resolve() == destination.resolve():
-            return str(destination)
-
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(local_path, destination)
-        return str(destination)
+        # Skip if source and destination are the same file. samefile compares
+        # device and inode from one stat each instead of resolving both paths;
+        # a destination that doesn't exist yet can't be the source.
+        try:
+            if os.path.samefile(local_path, destination):
+                self._exists_cache.set(remote_key, True)
+                return os.fspath(destination)
+        except FileNotFoundError:
+            pass
+
+        self._ensure_parent(destination)
+        try:
+            _copy_file(local_path, destination)
+        except FileNotFoundError:
+            # The parent may have been removed outside this backend
+            self._forget_dirs()
+            self._ensure_parent(destination)
+            _copy_file(local_path, destination)
+        self._exists_cache.set(remote_key, True)
+        return os.fspath(destination)
 
     def upload_bytes(
         self,
@@ -64,9 +99,16 @@ class LocalStorageBackend(BaseStorageBackend):
             Absolute path to the stored file.
         """
         destination = self.base_path / remote_key
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_bytes(data)
-        return str(destination)
+        self._ensure_parent(destination)
+        try:
+            destination.write_bytes(data)
+        except FileNotFoundError:
+            # The parent may have been removed outside this backend
+            self._forget_dirs()
+            self._ensure_parent(destination)
+            destination.write_bytes(data)
+        self._exists_cache.set(remote_key, True)
+        return os.fspath(destination)
 
     def get_url(
         self,
@@ -75,6 +117,9 @@ class LocalStorageBackend(BaseStorageBackend):
     ) -> Optional[str]:
         """Get the file path for a stored file.
 
+        Keys written by this backend are known to exist (see exists), so the
+        usual upload-then-get_url sequence does not touch the filesystem.
+
         Args:
             remote_key: Relative path/key of the file.
             expires_in: Ignored for local storage.
@@ -82,19 +127,40 @@ class LocalStorageBackend(BaseStorageBackend):
         Returns:
             Absolute path to the file if it exists, None otherwise.
         """
-        file_path = self.base_path / remote_key
-        return str(file_path) if file_path.exists() else None
+        if self.exists(remote_key):
+            return os.path.join(self._base_str, remote_key)
+        return None
 
     def exists(self, remote_key: str) -> bool:
         """Check if a file exists.
 
+        Results, including negative ones, are cached for EXISTS_CACHE_TTL
+        seconds and kept current by this backend's own uploads and deletes.
+        Call invalidate() after changing files through other means.
+
         Args:
             remote_key: Relative path/key to check.
 
         Returns:
             True if the file exists.
         """
-        return (self.base_path / remote_key).exists()
+        cached = self._exists_cache.get(remote_key)
+        if cached is not None:
+            return cached
+        result = os.path.exists(os.path.join(self._base_str, remote_key))
+        self._exists_cache.set(remote_key, result)
+        return result
+
+    def invalidate(self, remote_key: Optional[str] = None) -> None:
+        """Drop the cached exists() result for a key, or for all keys.
+
+        Args:
+            remote_key: Key to forget. If None, the whole cache is cleared.
+        """
+        if remote_key is None:
+            self._exists_cache.clear()
+        else:
+            self._exists_cache.pop(remote_key)
 
     def delete(self, remote_key: str) -> bool:
         """Delete a file.
@@ -109,8 +175,12 @@ class LocalStorageBackend(BaseStorageBackend):
         if path.exists():
             if path.is_dir():
                 shutil.rmtree(path)
+                # Any cached key or directory under it is now stale
+                self._exists_cache.clear()
+                self._forget_dirs()
             else:
                 path.unlink()
+            self._exists_cache.set(remote_key, False)
             return True
         return False
 
@@ -123,13 +193,47 @@ class LocalStorageBackend(BaseStorageBackend):
         Returns:
             List of relative file paths.
         """
-        base = self.base_path / prefix
-        if base.is_dir():
-            return [
-                str(p.relative_to(self.base_path))
-                for p in base.rglob("*")
-                if p.is_file()
-            ]
-        elif base.is_file():
+        base = os.path.join(self._base_str, prefix)
+        if os.path.isdir(base):
+            # Paths from os.walk start with "<base_path>/"; strip it
+            base_len = len(os.path.join(self._base_str, ""))
+            files = []
+            for root, _dirs, names in os.walk(base):
+                rel_root = root[base_len:]
+                files.extend(os.path.join(rel_root, name) for name in names)
+            return files
+        elif os.path.isfile(base):
             return [prefix]
         return []
+
+
+def _copy_file(source: Path, destination: Path) -> None:
+    """Copy a file's contents and metadata like shutil.copy2.
+
+    On Linux the data is copied in-kernel with os.copy_file_range, which
+    never passes through userspace and can share blocks (reflink) on
+    filesystems that support it. Elsewhere, if the kernel refuses the
+    call, or if it stops before the whole file is copied (some virtual
+    filesystems report zero bytes), shutil.copy2 is used.
+
+    Args:
+        source: File to copy.
+        destination: Path to write the copy to.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(source, destination)
+                return
+            # Stopped short; copy2 below rewrites the whole file
+        except OSError:
+            # e.g. EXDEV across filesystems on older kernels, or EINVAL
+            pass
+    shutil.copy2(source, destination)
@@ -1,16 +1,54 @@
 """Cloudflare R2 storage backend (S3-compatible)."""
 
+import io
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
 
 from ..base import BaseStorageBackend
+from ..cache import TTLCache
 
 if TYPE_CHECKING:
     from tradingagents.config import R2StorageConfig
 
 logger = logging.getLogger(__name__)
 
+# MIME types by file extension for uploads without an explicit content type
+_CONTENT_TYPES = MappingProxyType(
+    {
+        ".md": "text/markdown",
+        ".pdf": "application/pdf",
+        ".json": "application/json",
+        ".txt": "text/plain",
+        ".html": "text/html",
+        ".css": "text/css",
+        ".js": "application/javascript",
+        ".png": "image/png",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".gif": "image/gif",
+        ".svg": "image/svg+xml",
+    }
+)
+
+# head_object error codes meaning the key does not exist
+_NOT_FOUND_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+
+# HTTP connections kept open by the boto3 client (botocore default is 10)
+MAX_POOL_CONNECTIONS = 50
+
+# Keys requested per list_objects_v2 call (the S3 maximum)
+LIST_PAGE_SIZE = 1000
+
+# Keys removed per delete_objects call (the S3 maximum)
+DELETE_BATCH_SIZE = 1000
+
+# Objects larger than this are uploaded in parts of the same size
+MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+
 
 class R2StorageBackend(BaseStorageBackend):
     """Storage backend for Cloudflare R2 (S3-compatible).
@@ -21,6 +59,12 @@ class R2StorageBackend(BaseStorageBackend):
 
     backend_name = "r2"
 
+    # Seconds an exists() result is reused before issuing another HEAD request
+    EXISTS_CACHE_TTL = 30.0
+
+    # Upper bound in seconds on how long a presigned URL is reused
+    URL_CACHE_MAX_TTL = 1800
+
     def __init__(self, config: "R2StorageConfig"):
         """Initialize R2 storage backend.
 
@@ -29,6 +73,10 @@ class R2StorageBackend(BaseStorageBackend):
         """
         self.config = config
         self._client = None
+        self._client_lock = threading.Lock()
+        self._transfer_config = None
+        self._exists_cache = TTLCache(maxsize=1024, ttl=self.EXISTS_CACHE_TTL)
+        self._url_cache = TTLCache(maxsize=512, ttl=self.URL_CACHE_MAX_TTL)
 
     @property
     def client(self):
@@ -41,26 +89,67 @@ class R2StorageBackend(BaseStorageBackend):
             ImportError: If boto3 is not installed.
         """
         if self._client is None:
-            try:
-                import boto3
-                from botocore.config import Config
-            except ImportError:
-                raise ImportError(
-                    "boto3 is required for R2 storage. "
-                    "Install it with: pip install boto3"
-                )
+            # warm_up() may be building the client on another thread
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def warm_up(self) -> None:
+        """Import boto3 and build the client ahead of the first request.
+
+        Meant to run on a background thread; failures are logged and left
+        for the first real call to report.
+        """
+        try:
+            self.client
+            self.transfer_config
+        except Exception as e:
+            logger.debug(f"R2 client warm-up failed: {e}")
 
-            self._client = boto3.client(
-                "s3",
-                endpoint_url=self.config.endpoint_url,
-                aws_access_key_id=self.config.access_key_id,
-                aws_secret_access_key=self.config.secret_access_key,
-                config=Config(
-                    signature_version="s3v4",
-                    retries={"max_attempts": 3, "mode": "adaptive"},
-                ),
+    def _create_client(self):
+        """Import boto3 and build the S3 client for R2."""
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise ImportError(
+                "boto3 is required for R2 storage. "
+                "Install it with: pip install boto3"
             )
-        return self._client
+
+        return boto3.client(
+            "s3",
+            endpoint_url=self.config.endpoint_url,
+            aws_access_key_id=self.config.access_key_id,
+            aws_secret_access_key=self.config.secret_access_key,
+            config=Config(
+                signature_version="s3v4",
+                retries={"max_attempts": 3, "mode": "adaptive"},
+                # Room for concurrent StorageService and multipart
+                # uploads without queueing on the connection pool
+                max_pool_connections=MAX_POOL_CONNECTIONS,
+                tcp_keepalive=True,
+            ),
+        )
+
+    @property
+    def transfer_config(self):
+        """Lazy initialization of the boto3 multipart transfer settings.
+
+        Returns:
+            boto3 TransferConfig used for managed uploads.
+        """
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+
+            self._transfer_config = TransferConfig(
+                multipart_threshold=MULTIPART_CHUNK_SIZE,
+                multipart_chunksize=MULTIPART_CHUNK_SIZE,
+                max_concurrency=10,
+                use_threads=True,
+            )
+        return self._transfer_config
 
     def upload_file(
         self,
@@ -83,12 +172,14 @@ class R2StorageBackend(BaseStorageBackend):
         }
 
         self.client.upload_file(
-            str(local_path),
+            os.fspath(local_path),
             self.config.bucket_name,
             remote_key,
             ExtraArgs=extra_args,
+            Config=self.transfer_config,
         )
 
+        self._exists_cache.set(remote_key, True)
         logger.debug(f"Uploaded file to R2: {remote_key}")
         return f"r2://{self.config.bucket_name}/{remote_key}"
 
@@ -97,24 +188,45 @@ class R2StorageBackend(BaseStorageBackend):
         data: bytes,
         remote_key: str,
         content_type: Optional[str] = None,
+        content_encoding: Optional[str] = None,
     ) -> str:
         """Upload bytes directly to R2.
 
+        Small payloads go out in a single put_object request; payloads above
+        MULTIPART_CHUNK_SIZE use a managed multipart upload.
+
         Args:
             data: The bytes to upload.
             remote_key: The key/path to store the data under in R2.
             content_type: Optional MIME type. Auto-detected if not provided.
+            content_encoding: Optional Content-Encoding of data, e.g. "gzip".
 
         Returns:
             R2 URI in format r2://bucket/key.
         """
-        self.client.put_object(
-            Bucket=self.config.bucket_name,
-            Key=remote_key,
-            Body=data,
-            ContentType=content_type or self._guess_content_type(remote_key),
-        )
+        extra_args = {
+            "ContentType": content_type or self._guess_content_type(remote_key)
+        }
+        if content_encoding:
+            extra_args["ContentEncoding"] = content_encoding
+
+        if len(data) > MULTIPART_CHUNK_SIZE:
+            self.client.upload_fileobj(
+                io.BytesIO(data),
+                self.config.bucket_name,
+                remote_key,
+                ExtraArgs=extra_args,
+                Config=self.transfer_config,
+            )
+        else:
+            self.client.put_object(
+                Bucket=self.config.bucket_name,
+                Key=remote_key,
+                Body=data,
+                **extra_args,
+            )
 
+        self._exists_cache.set(remote_key, True)
         logger.debug(f"Uploaded bytes to R2: {remote_key}")
         return f"r2://{self.config.bucket_name}/{remote_key}"
 
@@ -126,7 +238,8 @@ class R2StorageBackend(BaseStorageBackend):
         """Generate a URL for accessing a file.
 
         If public_url is configured, returns a permanent public URL.
-        Otherwise, generates a presigned URL with expiration.
+        Otherwise, generates a presigned URL with expiration. Presigned URLs
+        are cached per (remote_key, expires_in) for up to half their lifetime.
 
         Args:
             remote_key: The key/path of the file in R2.
@@ -144,6 +257,11 @@ class R2StorageBackend(BaseStorageBackend):
         if expires_in is None:
             expires_in = self.config.presigned_url_expiry
 
+        cache_key = (remote_key, expires_in)
+        url = self._url_cache.get(cache_key)
+        if url is not None:
+            return url
+
         try:
             url = self.client.generate_presigned_url(
                 "get_object",
@@ -153,6 +271,11 @@ class R2StorageBackend(BaseStorageBackend):
                 },
                 ExpiresIn=expires_in,
             )
+            # Reuse for at most half its lifetime so callers always get a
+            # URL with at least half of expires_in remaining
+            self._url_cache.set(
+                cache_key, url, ttl=min(expires_in / 2, self.URL_CACHE_MAX_TTL)
+            )
             return url
         except Exception as e:
             logger.error(f"Failed to generate presigned URL for {remote_key}: {e}")
@@ -161,28 +284,39 @@ class R2StorageBackend(BaseStorageBackend):
     def exists(self, remote_key: str) -> bool:
         """Check if a file exists in R2.
 
+        Results, including negative ones, are cached for EXISTS_CACHE_TTL
+        seconds and kept current by this backend's own uploads and deletes.
+        Call invalidate() when the bucket may have changed elsewhere.
+
         Args:
             remote_key: The key/path to check.
 
         Returns:
             True if the file exists, False otherwise.
         """
+        cached = self._exists_cache.get(remote_key)
+        if cached is not None:
+            return cached
+
+        from botocore.exceptions import ClientError
+
         try:
             self.client.head_object(
                 Bucket=self.config.bucket_name,
                 Key=remote_key,
             )
+            self._exists_cache.set(remote_key, True)
             return True
-        except Exception as e:
-            # Check for 404 errors (ClientError with 404 code)
-            error_code = getattr(getattr(e, "response", {}), "get", lambda *a: None)(
-                "Error", {}
-            ).get("Code")
-            if error_code == "404":
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code")
+            if error_code in _NOT_FOUND_CODES:
+                self._exists_cache.set(remote_key, False)
                 return False
-            # For any other error, log and return False
-            if hasattr(e, "response"):
-                logger.debug(f"Error checking existence of {remote_key}: {e}")
+            # Permission or server errors say nothing about existence; don't cache
+            logger.warning(f"Error checking existence of {remote_key} ({error_code}): {e}")
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to check existence of {remote_key}: {e}")
             return False
 
     def delete(self, remote_key: str) -> bool:
@@ -199,12 +333,70 @@ class R2StorageBackend(BaseStorageBackend):
                 Bucket=self.config.bucket_name,
                 Key=remote_key,
             )
+            self._exists_cache.set(remote_key, False)
             logger.debug(f"Deleted from R2: {remote_key}")
             return True
         except Exception as e:
+            self._exists_cache.pop(remote_key)
             logger.error(f"Failed to delete {remote_key} from R2: {e}")
             return False
 
+    def delete_many(self, remote_keys: Sequence[str]) -> Dict[str, bool]:
+        """Delete several files from R2 with batched DeleteObjects requests.
+
+        Keys are sent DELETE_BATCH_SIZE at a time, so N keys cost
+        ceil(N / DELETE_BATCH_SIZE) requests instead of N.
+
+        Args:
+            remote_keys: The keys/paths of the files to delete.
+
+        Returns:
+            Dict mapping each key to deletion success status.
+        """
+        results: Dict[str, bool] = {}
+        for start in range(0, len(remote_keys), DELETE_BATCH_SIZE):
+            chunk = remote_keys[start : start + DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.config.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in chunk],
+                        "Quiet": True,
+                    },
+                )
+            except Exception as e:
+                logger.error(f"Failed to delete {len(chunk)} keys from R2: {e}")
+                for key in chunk:
+                    results[key] = False
+                    self._exists_cache.pop(key)
+                continue
+
+            # Quiet mode only reports the keys that failed
+            for error in response.get("Errors", []):
+                key = error.get("Key")
+                logger.error(
+                    f"Failed to delete {key} from R2: {error.get('Message', error.get('Code'))}"
+                )
+                results[key] = False
+                self._exists_cache.pop(key)
+            for key in chunk:
+                if results.setdefault(key, True):
+                    self._exists_cache.set(key, False)
+
+        logger.debug(f"Deleted {sum(results.values())} of {len(results)} keys from R2")
+        return results
+
+    def invalidate(self, remote_key: Optional[str] = None) -> None:
+        """Drop the cached exists() result for a key, or for all keys.
+
+        Args:
+            remote_key: Key to forget. If None, the whole cache is cleared.
+        """
+        if remote_key is None:
+            self._exists_cache.clear()
+        else:
+            self._exists_cache.pop(remote_key)
+
     def list_files(self, prefix: str) -> List[str]:
         """List files with a given prefix in R2.
 
@@ -215,17 +407,14 @@ class R2StorageBackend(BaseStorageBackend):
             List of file keys matching the prefix.
         """
         try:
-            keys = []
             paginator = self.client.get_paginator("list_objects_v2")
-
-            for page in paginator.paginate(
+            pages = paginator.paginate(
                 Bucket=self.config.bucket_name,
                 Prefix=prefix,
-            ):
-                for obj in page.get("Contents", []):
-                    keys.append(obj["Key"])
-
-            return keys
+                PaginationConfig={"PageSize": LIST_PAGE_SIZE},
+            )
+            # Project each page down to its keys; empty pages yield None
+            return [key for key in pages.search("Contents[].Key") if key is not None]
         except Exception as e:
             logger.error(f"Failed to list files with prefix {prefix}: {e}")
             return []
@@ -239,19 +428,5 @@ class R2StorageBackend(BaseStorageBackend):
         Returns:
             MIME type string.
         """
-        extension = Path(key).suffix.lower()
-        content_types = {
-            ".md": "text/markdown",
-            ".pdf": "application/pdf",
-            ".json": "application/json",
-            ".txt": "text/plain",
-            ".html": "text/html",
-            ".css": "text/css",
-            ".js": "application/javascript",
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".svg": "image/svg+xml",
-        }
-        return content_types.get(extension, "application/octet-stream")
+        extension = os.path.splitext(key)[1].lower()
+        return _CONTENT_TYPES.get(extension, "application/octet-stream")
@@ -2,7 +2,7 @@
 
 from abc import ABC
 from pathlib import Path
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import Dict, FrozenSet, List, Optional, Protocol, Sequence, runtime_checkable
 
 
 @runtime_checkable
@@ -110,6 +110,24 @@ class BaseStorageBackend(ABC):
 
     backend_name: str = "base"
 
+    # Names of the public methods the class overrides; see __init_subclass__
+    _supported: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        """Record which public BaseStorageBackend methods the subclass overrides.
+
+        The answer never changes after class creation, so supports() is a
+        single set lookup instead of resolving methods on every call.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._supported = frozenset(
+            name
+            for name, base_func in vars(BaseStorageBackend).items()
+            if not name.startswith("_")
+            and callable(base_func)
+            and getattr(cls, name) is not base_func
+        )
+
     def upload_file(
         self,
         local_path: Path,
@@ -144,10 +162,31 @@ class BaseStorageBackend(ABC):
         """Delete a file from storage."""
         raise NotImplementedError(f"{self.backend_name} does not support delete")
 
+    def delete_many(self, remote_keys: Sequence[str]) -> Dict[str, bool]:
+        """Delete several files.
+
+        The default deletes keys one at a time; backends with a bulk delete
+        API override it.
+
+        Args:
+            remote_keys: The keys/paths of the files to delete.
+
+        Returns:
+            Dict mapping each key to deletion success status.
+        """
+        return {key: self.delete(key) for key in remote_keys}
+
     def list_files(self, prefix: str) -> List[str]:
         """List files with a given prefix."""
         raise NotImplementedError(f"{self.backend_name} does not support list_files")
 
+    def invalidate(self, remote_key: Optional[str] = None) -> None:
+        """Drop cached state for a key, or for all keys if none is given.
+
+        Backends that cache lookups (such as exists) override this; the
+        default has nothing to invalidate.
+        """
+
     def supports(self, method: str) -> bool:
         """Check if this backend supports the given method.
 
@@ -157,9 +196,4 @@ class BaseStorageBackend(ABC):
         Returns:
             True if the method is implemented, False otherwise.
         """
-        try:
-            func = getattr(self, method)
-            base_func = getattr(BaseStorageBackend, method, None)
-            return func.__func__ is not base_func
-        except AttributeError:
-            return False
+        return method in type(self)._supported
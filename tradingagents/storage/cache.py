@@ -0,0 +1,67 @@
+"""Small thread-safe caches used by storage backends."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire after a fixed time-to-live.
+
+    When full, the least recently stored entry is evicted. All operations
+    are guarded by a lock so a backend can be shared between the worker
+    threads of StorageService.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Seconds after which an entry is treated as missing.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if absent or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, replacing any existing entry for key.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Lifetime in seconds for this entry. Defaults to the cache ttl.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (expires_at, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,84 +1,126 @@
 """PDF conversion for markdown reports."""
 
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import markdown
-from weasyprint import HTML
+from weasyprint import CSS, HTML
+
+logger = logging.getLogger(__name__)
+
+# Stylesheet for converted reports, parsed once per process by _stylesheet()
+_REPORT_CSS = """
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    line-height: 1.6;
+    max-width: 800px;
+    margin: 40px auto;
+    padding: 20px;
+    color: #333;
+}
+h1, h2, h3 { color: #2c3e50; }
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 20px 0;
+}
+th, td {
+    border: 1px solid #ddd;
+    padding: 8px;
+    text-align: left;
+}
+th { background-color: #f4f4f4; }
+code {
+    background-color: #f4f4f4;
+    padding: 2px 6px;
+    border-radius: 3px;
+}
+pre {
+    background-color: #f4f4f4;
+    padding: 15px;
+    border-radius: 5px;
+    overflow-x: auto;
+}
+"""
+
+# HTML wrapper for converted markdown; {body} is the report body
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+@lru_cache(maxsize=None)
+def _stylesheet() -> CSS:
+    """Return the parsed report stylesheet, shared by every conversion."""
+    return CSS(string=_REPORT_CSS)
+
+
+def _convert_one(md_file: Path) -> Optional[Path]:
+    """Convert a single markdown file to a PDF next to it.
+
+    Runs in a worker process, so failures are reported and swallowed here
+    rather than aborting the rest of the batch.
+
+    Args:
+        md_file: Markdown file to convert
+
+    Returns:
+        Path to the generated PDF, or None if conversion failed
+    """
+    try:
+        # Convert markdown to HTML
+        md_content = md_file.read_text(encoding="utf-8")
+        html_content = markdown.markdown(
+            md_content,
+            extensions=["tables", "fenced_code"],
+        )
+
+        # Convert to PDF
+        pdf_path = md_file.with_suffix(".pdf")
+        full_html = _HTML_TEMPLATE.format(body=html_content)
+        HTML(string=full_html).write_pdf(str(pdf_path), stylesheets=[_stylesheet()])
+        return pdf_path
+
+    except Exception as e:
+        logger.warning(f"Failed to convert {md_file.name} to PDF: {e}")
+        return None
 
 
 def convert_reports_to_pdf(report_dir: Path) -> List[Path]:
     """Convert all markdown files in directory to PDF.
 
+    Files are converted in parallel worker processes, since rendering is
+    CPU-bound. Workers are spawned rather than forked: callers such as
+    StorageService keep threads running, and forking a process while
+    another thread holds a lock (for example mid-import) can deadlock.
+
     Args:
         report_dir: Directory containing markdown files
 
     Returns:
         List of paths to generated PDF files
     """
-    pdf_paths = []
-
-    for md_file in report_dir.glob("*.md"):
-        try:
-            # Convert markdown to HTML
-            md_content = md_file.read_text(encoding="utf-8")
-            html_content = markdown.markdown(
-                md_content,
-                extensions=["tables", "fenced_code"],
-            )
-
-            # Wrap in basic HTML structure with styling
-            full_html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                        line-height: 1.6;
-                        max-width: 800px;
-                        margin: 40px auto;
-                        padding: 20px;
-                        color: #333;
-                    }}
-                    h1, h2, h3 {{ color: #2c3e50; }}
-                    table {{
-                        border-collapse: collapse;
-                        width: 100%;
-                        margin: 20px 0;
-                    }}
-                    th, td {{
-                        border: 1px solid #ddd;
-                        padding: 8px;
-                        text-align: left;
-                    }}
-                    th {{ background-color: #f4f4f4; }}
-                    code {{
-                        background-color: #f4f4f4;
-                        padding: 2px 6px;
-                        border-radius: 3px;
-                    }}
-                    pre {{
-                        background-color: #f4f4f4;
-                        padding: 15px;
-                        border-radius: 5px;
-                        overflow-x: auto;
-                    }}
-                </style>
-            </head>
-            <body>
-                {html_content}
-            </body>
-            </html>
-            """
-
-            # Convert to PDF
-            pdf_path = md_file.with_suffix(".pdf")
-            HTML(string=full_html).write_pdf(str(pdf_path))
-            pdf_paths.append(pdf_path)
-
-        except Exception as e:
-            print(f"  Warning: Failed to convert {md_file.name} to PDF: {e}")
-
-    return pdf_paths
+    md_files = list(report_dir.glob("*.md"))
+    if len(md_files) <= 1:
+        results = [_convert_one(md_file) for md_file in md_files]
+    else:
+        max_workers = min(os.cpu_count() or 1, len(md_files))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            results = list(executor.map(_convert_one, md_files))
+
+    return [pdf_path for pdf_path in results if pdf_path is not None]
@@ -1,8 +1,23 @@
 """Storage service facade for managing multiple storage backends."""
 
+import gzip
+import io
 import logging
+import tarfile
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .backends.local import LocalStorageBackend
 from .base import BaseStorageBackend
@@ -12,13 +27,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent backend calls per operation
+MAX_BACKEND_WORKERS = 8
+
+# Content types worth gzipping before sending to R2
+_COMPRESSIBLE_TYPES = ("text/", "application/json")
+
+# Compressed payloads are only used when at most this fraction of the original
+GZIP_MAX_RATIO = 0.9
+
 
 class StorageService:
     """Unified storage service supporting multiple backends.
 
     This service manages multiple storage backends and provides a unified
     interface for uploading reports. By default, it writes to all configured
-    backends (local and R2 if configured).
+    backends (local and R2 if configured). Backends are called concurrently,
+    so an operation takes as long as the slowest backend rather than the sum.
+    Call close() (or use the service as a context manager) to release the
+    worker threads.
     """
 
     def __init__(self, config: "StorageConfig"):
@@ -31,6 +58,35 @@ class StorageService:
         self._primary_backend: str = "local"
         self._config = config
         self._init_backends(config)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_BACKEND_WORKERS, len(self._backends))),
+            thread_name_prefix="storage",
+        )
+
+    def close(self) -> None:
+        """Shut down the worker threads used for backend calls."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "StorageService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _submit_all(self, method: str, *args) -> Dict[str, Future]:
+        """Call a method on every backend concurrently.
+
+        Args:
+            method: Name of the backend method to call.
+            *args: Positional arguments for the method.
+
+        Returns:
+            Dict mapping backend name to the future of its call, in backend order.
+        """
+        return {
+            name: self._executor.submit(getattr(backend, method), *args)
+            for name, backend in self._backends.items()
+        }
 
     def _init_backends(self, config: "StorageConfig") -> None:
         """Initialize storage backends from configuration.
@@ -48,8 +104,13 @@ class StorageService:
             try:
                 from .backends.r2 import R2StorageBackend
 
-                self._backends["r2"] = R2StorageBackend(config.r2)
+                r2_backend = R2StorageBackend(config.r2)
+                self._backends["r2"] = r2_backend
                 self._primary_backend = "r2"
+                # Pay the boto3 import and client setup off the startup path
+                threading.Thread(
+                    target=r2_backend.warm_up, name="r2-warm-up", daemon=True
+                ).start()
                 logger.info(
                     f"R2 storage backend initialized for bucket {config.r2.bucket_name}"
                 )
@@ -69,6 +130,9 @@ class StorageService:
     ) -> Dict[str, str]:
         """Upload report content to all configured backends.
 
+        Waits for every backend; use upload_report_stream to act on each
+        backend's result as soon as it is ready.
+
         Args:
             content: Report content as string.
             remote_key: The key/path to store the report under.
@@ -78,21 +142,138 @@ class StorageService:
             Dict mapping backend name to storage path/URI.
         """
         results = {}
+        stream = self.upload_report_stream(content, remote_key, content_type)
+        for name, result in stream:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to upload {remote_key} to {name}: {result}")
+            else:
+                results[name] = result
+                logger.debug(f"Uploaded {remote_key} to {name}")
+        return results
+
+    def upload_report_stream(
+        self,
+        content: str,
+        remote_key: str,
+        content_type: Optional[str] = None,
+    ) -> Iterator[Tuple[str, Union[str, Exception]]]:
+        """Upload report content to all backends, yielding results as they finish.
+
+        Uploads start when iteration begins. Text reports are gzipped once
+        and sent to R2 with a gzip Content-Encoding, which clients decompress
+        transparently. The local backend always gets the plain bytes so files
+        stay browsable.
+
+        Args:
+            content: Report content as string.
+            remote_key: The key/path to store the report under.
+            content_type: Optional MIME type. Defaults to text/markdown for .md files.
+
+        Yields:
+            (backend name, storage path/URI) for each backend in completion
+            order, with the raised exception in place of the path on failure.
+        """
         data = content.encode("utf-8")
 
         if content_type is None and remote_key.endswith(".md"):
             content_type = "text/markdown"
 
+        compressed = None
+        if "r2" in self._backends and content_type and content_type.startswith(
+            _COMPRESSIBLE_TYPES
+        ):
+            compressed = gzip.compress(data, compresslevel=6)
+            if len(compressed) > len(data) * GZIP_MAX_RATIO:
+                compressed = None
+
+        futures = {}
+        for name, backend in self._backends.items():
+            if name == "r2" and compressed is not None:
+                future = self._executor.submit(
+                    backend.upload_bytes,
+                    compressed,
+                    remote_key,
+                    content_type,
+                    content_encoding="gzip",
+                )
+            else:
+                future = self._executor.submit(
+                    backend.upload_bytes, data, remote_key, content_type
+                )
+            futures[future] = name
+
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                yield futures[future], e
+
+    def upload_report_batch(
+        self,
+        reports: Sequence[Tuple[str, str]],
+        batch_id: Optional[str] = None,
+    ) -> Dict[str, List[str]]:
+        """Upload several reports, bundling them into one object for remote backends.
+
+        The local backend still receives one file per report so the reports
+        stay browsable. Every other backend receives a single gzipped tar
+        archive at ``batches/<batch_id>.tar.gz`` whose members are named by
+        remote key, so a batch costs one request instead of one per report.
+
+        Args:
+            reports: (remote_key, content) pairs to upload.
+            batch_id: Name for the archive. Defaults to a random hex id.
+
+        Returns:
+            Dict mapping backend name to the storage paths/URIs written.
+        """
+        results: Dict[str, List[str]] = {}
+        if not reports:
+            return results
+
+        files = [(key, content.encode("utf-8")) for key, content in reports]
+        archive_key = f"batches/{batch_id or uuid.uuid4().hex}.tar.gz"
+        archive = None
+        if any(name != "local" for name in self._backends):
+            archive = self._build_archive(files)
+
+        futures = {}
         for name, backend in self._backends.items():
+            if name == "local":
+                futures[name] = self._executor.submit(self._upload_each, backend, files)
+            else:
+                futures[name] = self._executor.submit(
+                    backend.upload_bytes, archive, archive_key, "application/gzip"
+                )
+
+        for name, future in futures.items():
             try:
-                result = backend.upload_bytes(data, remote_key, content_type)
-                results[name] = result
-                logger.debug(f"Uploaded {remote_key} to {name}")
+                result = future.result()
+                results[name] = result if name == "local" else [result]
+                logger.debug(f"Uploaded batch of {len(files)} reports to {name}")
             except Exception as e:
-                logger.error(f"Failed to upload {remote_key} to {name}: {e}")
+                logger.error(f"Failed to upload batch {archive_key} to {name}: {e}")
 
         return results
 
+    @staticmethod
+    def _upload_each(
+        backend: BaseStorageBackend, files: List[Tuple[str, bytes]]
+    ) -> List[str]:
+        """Upload files one by one to a backend."""
+        return [backend.upload_bytes(data, key, None) for key, data in files]
+
+    @staticmethod
+    def _build_archive(files: List[Tuple[str, bytes]]) -> bytes:
+        """Pack files into an in-memory gzipped tar archive."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for key, data in files:
+                info = tarfile.TarInfo(name=key)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+        return buffer.getvalue()
+
     def upload_report_auto(
         self,
         content: str,
@@ -132,9 +313,10 @@ class StorageService:
         """
         results = {}
 
-        for name, backend in self._backends.items():
+        futures = self._submit_all("upload_file", local_path, remote_key, content_type)
+        for name, future in futures.items():
             try:
-                result = backend.upload_file(local_path, remote_key, content_type)
+                result = future.result()
                 results[name] = result
                 logger.debug(f"Uploaded file {remote_key} to {name}")
             except Exception as e:
@@ -204,14 +386,38 @@ class StorageService:
             Dict mapping backend name to deletion success status.
         """
         results = {}
-        for name, backend in self._backends.items():
+        futures = self._submit_all("delete", remote_key)
+        for name, future in futures.items():
             try:
-                results[name] = backend.delete(remote_key)
+                results[name] = future.result()
             except Exception as e:
                 logger.error(f"Failed to delete {remote_key} from {name}: {e}")
                 results[name] = False
         return results
 
+    def delete_many(self, remote_keys: Sequence[str]) -> Dict[str, Dict[str, bool]]:
+        """Delete several reports from all backends.
+
+        Each backend deletes the whole set in one call (batched requests
+        for R2), and backends run concurrently.
+
+        Args:
+            remote_keys: The keys/paths of the reports to delete.
+
+        Returns:
+            Dict mapping backend name to a dict of key -> deletion success.
+        """
+        results = {}
+        keys = list(remote_keys)
+        futures = self._submit_all("delete_many", keys)
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to delete {len(keys)} reports from {name}: {e}")
+                results[name] = dict.fromkeys(keys, False)
+        return results
+
     def list_reports(self, prefix: str) -> Dict[str, List[str]]:
         """List reports with a given prefix from all backends.
 